@@ -0,0 +1,230 @@
+# bank_format.py
+# Compiled, memory-mapped question bank format.
+#
+# Layout (all integers little-endian, every section 4-byte aligned):
+#
+#   header        magic, version, counts and section offsets (HEADER struct)
+#   ids           u32[count]   question id
+#   topic_ids     u16[count]   index into the topic names
+#   answers       u8[count]    answer_index
+#   option_counts u8[count]    number of options
+#   string_base   u32[count]   first string of the question in the string table:
+#                              base = question, base + 1 = explanation,
+#                              base + 2 .. base + 1 + n_options = options
+#   tag_offsets   u32[count + 1]  question i's tags are tag_ids[tag_offsets[i]:tag_offsets[i + 1]]
+#   tag_ids       u16[tag_offsets[count]]  index into the tag names
+#   str_offsets   u32[string_count + 1]  byte offsets into the blob
+#   blob          UTF-8 text of every string, back to back
+#
+# Topic names are strings 0 .. topic_count - 1 of the string table, tag
+# names the tag_count strings after them.
+#
+# Opening a bank only maps the file and reads the header and topic names; a
+# question dict is materialized only when it is indexed.
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Sequence
+
+MAGIC = b"MCQBANK1"
+VERSION = 2
+
+# magic, version, count, topic_count, tag_count, string_count, blob_size,
+# then offsets of: ids, topic_ids, answers, option_counts, string_base,
+# tag_offsets, tag_ids, str_offsets, blob
+HEADER = struct.Struct("<8sIIIIII9I")
+
+_NATIVE_LITTLE = sys.byteorder == "little"
+
+
+def _align(n):
+    return (n + 3) & ~3
+
+
+def _column_bytes(typecode, values):
+    col = array(typecode, values)
+    if not _NATIVE_LITTLE:
+        col.byteswap()
+    return col.tobytes()
+
+
+def write_bank(questions, path):
+    """
+    Compile an iterable of question dicts into the bank format at `path`.
+
+    The file is written to a temporary name and moved into place, so a
+    reader never sees a half-written bank.
+    """
+    questions = list(questions)
+    topics = sorted({q["topic"] for q in questions})
+    topic_id = {t: i for i, t in enumerate(topics)}
+    tags = sorted({t for q in questions for t in q.get("tags", ())})
+    tag_id = {t: i for i, t in enumerate(tags)}
+
+    tag_offsets, tag_ids = [0], []
+    for q in questions:
+        tag_ids.extend(sorted(tag_id[t] for t in set(q.get("tags", ()))))
+        tag_offsets.append(len(tag_ids))
+
+    strings = topics + tags
+    string_base = []
+    for q in questions:
+        string_base.append(len(strings))
+        strings.append(q["question"])
+        strings.append(q["explanation"])
+        strings.extend(q["options"])
+
+    encoded = [s.encode("utf-8") for s in strings]
+    str_offsets = [0]
+    for b in encoded:
+        str_offsets.append(str_offsets[-1] + len(b))
+    blob = b"".join(encoded)
+
+    sections = [
+        _column_bytes("I", [q["id"] for q in questions]),
+        _column_bytes("H", [topic_id[q["topic"]] for q in questions]),
+        _column_bytes("B", [q["answer_index"] for q in questions]),
+        _column_bytes("B", [len(q["options"]) for q in questions]),
+        _column_bytes("I", string_base),
+        _column_bytes("I", tag_offsets),
+        _column_bytes("H", tag_ids),
+        _column_bytes("I", str_offsets),
+        blob,
+    ]
+
+    offsets = []
+    pos = _align(HEADER.size)
+    for data in sections:
+        offsets.append(pos)
+        pos = _align(pos + len(data))
+
+    header = HEADER.pack(
+        MAGIC, VERSION, len(questions), len(topics), len(tags), len(strings), len(blob),
+        *offsets
+    )
+
+    # a temp file unique to this call, so concurrent builds never share one
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), prefix=os.path.basename(path), suffix=".tmp"
+    )
+    try:
+        os.chmod(tmp_path, 0o644)  # mkstemp creates it private
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            for offset, data in zip(offsets, sections):
+                f.write(b"\0" * (offset - f.tell()))
+                f.write(data)
+            f.write(b"\0" * (pos - f.tell()))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class CompiledBank(Sequence):
+    """
+    Read-only view of a compiled bank file.
+
+    Behaves like the old list of question dicts: len(bank), bank[i] and
+    iteration all work, but each bank[i] decodes only that question from
+    the mapped file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(self._mm)
+
+        (magic, version, count, topic_count, tag_count, _string_count, blob_size,
+         ids_off, topics_off, answers_off, nopts_off, base_off,
+         tag_offsets_off, tag_ids_off, str_off, blob_off) = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} question bank")
+
+        self._count = count
+        self.ids = self._column(buf, ids_off, "I", count)
+        self.topic_ids = self._column(buf, topics_off, "H", count)
+        self.answers = self._column(buf, answers_off, "B", count)
+        self.option_counts = self._column(buf, nopts_off, "B", count)
+        self._string_base = self._column(buf, base_off, "I", count)
+        self.tag_offsets = self._column(buf, tag_offsets_off, "I", count + 1)
+        self.tag_ids = self._column(buf, tag_ids_off, "H", self.tag_offsets[count])
+        self._str_offsets = self._column(buf, str_off, "I", _string_count + 1)
+        self._blob = buf[blob_off:blob_off + blob_size]
+
+        self.topics = tuple(self._string(i) for i in range(topic_count))
+        self.tags = tuple(self._string(topic_count + i) for i in range(tag_count))
+        self._positions_by_id = None
+
+    @staticmethod
+    def _column(buf, offset, typecode, n):
+        size = array(typecode).itemsize
+        view = buf[offset:offset + n * size]
+        if _NATIVE_LITTLE:
+            return view.cast(typecode)
+        col = array(typecode, view.tobytes())
+        col.byteswap()
+        return col
+
+    def _string(self, i):
+        return str(self._blob[self._str_offsets[i]:self._str_offsets[i + 1]], "utf-8")
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("question bank index out of range")
+
+        base = self._string_base[i]
+        n_options = self.option_counts[i]
+        return {
+            "id": self.ids[i],
+            "topic": self.topics[self.topic_ids[i]],
+            "question": self._string(base),
+            "options": [self._string(base + 2 + k) for k in range(n_options)],
+            "answer_index": self.answers[i],
+            "explanation": self._string(base + 1),
+            "tags": self.tags_of(i),
+        }
+
+    def position_of(self, question_id):
+        """Bank position of the question with id `question_id`."""
+        if self._positions_by_id is None:
+            self._positions_by_id = {qid: pos for pos, qid in enumerate(self.ids)}
+        return self._positions_by_id[question_id]
+
+    def by_id(self, question_id):
+        """Question dict for `question_id` (KeyError if it is not in the bank)."""
+        return self[self.position_of(question_id)]
+
+    def topic_of(self, i):
+        """Topic name of bank position `i`, without decoding the question."""
+        return self.topics[self.topic_ids[i]]
+
+    def tags_of(self, i):
+        """Tag names of bank position `i`, without decoding the question."""
+        start, end = self.tag_offsets[i], self.tag_offsets[i + 1]
+        return [self.tags[t] for t in self.tag_ids[start:end]]
+
+
+def is_current(path):
+    """True if `path` holds a bank in this module's format version."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(HEADER.size)
+    except FileNotFoundError:
+        return False
+    if len(head) < HEADER.size:
+        return False
+    magic, version = HEADER.unpack(head)[:2]
+    return magic == MAGIC and version == VERSION
@@ -0,0 +1,126 @@
+# bank_validator.py
+# Build-time checks on the source question lists (used by build_bank.py).
+#
+# Every question must have a unique integer id, a topic, a stem, exactly
+# OPTION_COUNT non-empty options, an answer_index pointing at one of them and
+# an explanation; "tags", a list of tag names, is optional.
+# build_bank.build() refuses to write a bank with any problem, so code
+# reading the compiled bank can index q["options"] with q["answer_index"]
+# without checking.
+#
+# Per-question checks are independent, so large banks are split into shards
+# checked in worker processes; id uniqueness is then checked across shards.
+
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+OPTION_COUNT = 4
+MAX_ID = (1 << 32) - 1  # ids are stored as u32 (bank_format.py)
+
+SHARD_SIZE = 5000
+# below this many questions a process pool costs more than it saves
+PARALLEL_MIN = 20000
+
+# source is the source list name, index the position in that list
+Problem = namedtuple("Problem", "source index question_id message")
+
+
+class BankValidationError(ValueError):
+    """The source lists contain malformed questions; .problems lists them."""
+
+    def __init__(self, problems):
+        self.problems = problems
+        super().__init__(
+            f"{len(problems)} problem(s) in the question bank, first: {format_problem(problems[0])}"
+        )
+
+
+def format_problem(problem):
+    return f"{problem.source}[{problem.index}] id={problem.question_id!r}: {problem.message}"
+
+
+def check_question(q):
+    """Problems with one question dict, as messages (empty if it is fine)."""
+    if not isinstance(q, dict):
+        return [f"expected a dict, got {type(q).__name__}"]
+    messages = []
+
+    qid = q.get("id")
+    if type(qid) is not int or not 0 <= qid <= MAX_ID:
+        messages.append(f"id must be an integer in 0..{MAX_ID}, got {qid!r}")
+    for key in ("topic", "question", "explanation"):
+        value = q.get(key)
+        if not isinstance(value, str) or not value.strip():
+            messages.append(f"{key} must be a non-empty string")
+
+    options = q.get("options")
+    if not isinstance(options, list):
+        messages.append("options must be a list")
+        options = None
+    else:
+        if len(options) != OPTION_COUNT:
+            messages.append(f"expected {OPTION_COUNT} options, got {len(options)}")
+        if not all(isinstance(o, str) and o.strip() for o in options):
+            messages.append("every option must be a non-empty string")
+        elif len(set(options)) != len(options):
+            messages.append("options repeat")
+
+    answer = q.get("answer_index")
+    if type(answer) is not int:
+        messages.append(f"answer_index must be an integer, got {answer!r}")
+    elif options is not None and not 0 <= answer < len(options):
+        messages.append(f"answer_index {answer} is out of range for {len(options)} options")
+
+    tags = q.get("tags", [])
+    if not isinstance(tags, list) or not all(isinstance(t, str) and t.strip() for t in tags):
+        messages.append("tags must be a list of non-empty strings")
+
+    unknown = set(q) - {"id", "topic", "question", "options", "answer_index", "explanation", "tags"}
+    if unknown:
+        messages.append(f"unknown keys: {', '.join(sorted(unknown))}")
+    return messages
+
+
+def _check_shard(items):
+    return [
+        Problem(source, index, q.get("id") if isinstance(q, dict) else None, message)
+        for source, index, q in items
+        for message in check_question(q)
+    ]
+
+
+def validate(items, workers=None):
+    """
+    Check (source list name, index, question) items and return every
+    Problem found, in source order. Banks of PARALLEL_MIN questions or more
+    are checked in `workers` processes (default: one per CPU; 1 disables
+    the pool).
+    """
+    items = list(items)
+    shards = [items[i:i + SHARD_SIZE] for i in range(0, len(items), SHARD_SIZE)]
+    workers = workers or os.cpu_count() or 1
+    if len(items) >= PARALLEL_MIN and workers > 1 and len(shards) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as pool:
+            shard_problems = list(pool.map(_check_shard, shards))
+    else:
+        shard_problems = [_check_shard(shard) for shard in shards]
+    problems = [p for shard in shard_problems for p in shard]
+
+    # ids must be unique across every list, not just within a shard
+    first_seen = {}
+    for source, index, q in items:
+        qid = q.get("id") if isinstance(q, dict) else None
+        if type(qid) is not int:
+            continue
+        if qid in first_seen:
+            first_source, first_index = first_seen[qid]
+            problems.append(Problem(
+                source, index, qid, f"duplicate id (first used at {first_source}[{first_index}])"
+            ))
+        else:
+            first_seen[qid] = (source, index)
+
+    order = {(source, index): n for n, (source, index, _q) in enumerate(items)}
+    problems.sort(key=lambda p: order[(p.source, p.index)])
+    return problems
@@ -0,0 +1,86 @@
+# benchmarks/bench_adaptive.py
+# Cost of adaptive item selection and calibration (irt.py).
+#
+# Calibrates item parameters from simulated answers by students of known
+# ability, then plays adaptive quizzes against a synthetic bank and reports
+# the time per question pick and ability update, plus how close the final
+# estimate gets to the simulated ability.
+#
+# How to run:
+#   python benchmarks/bench_adaptive.py
+#   python benchmarks/bench_adaptive.py --bank-size 30000 --length 50
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+from synthetic import synthetic_bank
+
+from irt import AdaptiveOrder, ItemParameters
+from question_store import TopicIndex
+from responses import Response
+
+
+def simulated_rows(bank, n_students, per_student, rng):
+    """(question_id, person, correct) rows from a 1PL model with known difficulty."""
+    difficulty = rng.normal(0.0, 1.0, len(bank))
+    ids = np.asarray(bank.ids)
+    rows = []
+    for student in range(n_students):
+        theta = rng.normal()
+        items = rng.choice(len(bank), per_student, replace=False)
+        p = 1.0 / (1.0 + np.exp(-(theta - difficulty[items])))
+        correct = rng.random(per_student) < p
+        rows.extend(zip(ids[items].tolist(), [f"s{student}"] * per_student, correct.tolist()))
+    return rows, difficulty
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Cost of adaptive item selection and calibration (irt.py)."
+    )
+    parser.add_argument("--bank-size", type=int, default=30000)
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--answers-per-student", type=int, default=100)
+    parser.add_argument("--quizzes", type=int, default=50)
+    parser.add_argument("--length", type=int, default=30)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        bank = synthetic_bank(args.bank_size, tmp)
+        topic_index = TopicIndex(bank)
+        rows, difficulty = simulated_rows(bank, args.students, args.answers_per_student, rng)
+
+        start = time.perf_counter()
+        params = ItemParameters.calibrate(bank, rows)
+        calibrate_s = time.perf_counter() - start
+        seen = params.n_responses > 0
+        fit = np.corrcoef(params.b[seen], difficulty[seen])[0, 1]
+
+        picks, updates, errors = [], [], []
+        for quiz in range(args.quizzes):
+            theta = rng.normal()
+            order = AdaptiveOrder(topic_index, params, args.length, seed=quiz)
+            for i in range(len(order)):
+                t0 = time.perf_counter()
+                pos = order[i]
+                t1 = time.perf_counter()
+                correct = rng.random() < 1.0 / (1.0 + np.exp(-(theta - difficulty[pos])))
+                order.record(i, Response(bank.ids[pos], 0, bool(correct)))
+                t2 = time.perf_counter()
+                picks.append(t1 - t0)
+                updates.append(t2 - t1)
+            errors.append(order.ability.theta - theta)
+
+    print(f"bank size:            {args.bank_size}")
+    print(f"calibration:          {calibrate_s * 1000:.0f} ms for {len(rows)} answers "
+          f"(difficulty r = {fit:.2f} vs simulated)")
+    print(f"pick, mean / p99:     {np.mean(picks) * 1e3:.3f} / {np.percentile(picks, 99) * 1e3:.3f} ms")
+    print(f"ability update, mean: {np.mean(updates) * 1e3:.3f} ms")
+    print(f"final theta RMSE after {args.length} questions: {np.sqrt(np.mean(np.square(errors))):.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# benchmarks/bench_engine.py
+# Throughput of the headless quiz engine, without Streamlit.
+#
+# Plays complete quizzes (start, answer every question, summary) through
+# QuizSession against a synthetic bank, as a load generator would. With
+# --persist every session and answer also goes through the write-behind
+# progress store, so the cost it adds to the answer path can be compared.
+#
+# How to run:
+#   python benchmarks/bench_engine.py
+#   python benchmarks/bench_engine.py --bank-size 30000 --sessions 200 --length 100
+#   python benchmarks/bench_engine.py --persist
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from synthetic import synthetic_bank
+
+from progress_store import ProgressStore, SessionRecorder
+from question_store import TopicIndex
+from quiz_engine import QuizSession
+
+
+def play(quiz, length, rng):
+    quiz.start(shuffled=True, seed=rng.getrandbits(64))
+    for _ in range(min(length, len(quiz))):
+        quiz.current_question()
+        quiz.answer(rng.randrange(4))
+        quiz.next()
+    quiz.finish()
+    return quiz.summary()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Throughput of the headless quiz engine, without Streamlit."
+    )
+    parser.add_argument("--bank-size", type=int, default=3000)
+    parser.add_argument("--sessions", type=int, default=100)
+    parser.add_argument("--length", type=int, default=50,
+                        help="questions answered per session")
+    parser.add_argument("--persist", action="store_true",
+                        help="record everything in a temporary progress store")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        bank = synthetic_bank(args.bank_size, tmp)
+        topic_index = TopicIndex(bank)
+        store = ProgressStore(os.path.join(tmp, "progress.sqlite3")) if args.persist else None
+
+        start = time.perf_counter()
+        answered = 0
+        for i in range(args.sessions):
+            recorder = SessionRecorder(store, f"user{i % 50}") if store else None
+            quiz = QuizSession(bank, topic_index, recorder=recorder)
+            answered += play(quiz, args.length, rng).total
+        elapsed = time.perf_counter() - start
+
+        print(f"bank={args.bank_size} sessions={args.sessions} answered={answered} "
+              f"persist={args.persist}")
+        print(f"{elapsed:.3f}s total, {answered / elapsed:,.0f} answers/s, "
+              f"{elapsed / answered * 1e6:.1f} us per answer")
+
+        if store:
+            start = time.perf_counter()
+            store.flush()
+            drain = time.perf_counter() - start
+            store.close()
+            print(f"store: {store.rows_written} rows in {store.batches_written} "
+                  f"transactions, {drain * 1000:.1f} ms left to drain after the run")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# benchmarks/bench_mock_exam.py
+# Cost of generating mock exam versions from a blueprint (mock_exam.py).
+#
+# Builds the per-topic pools for a synthetic bank, with a share of it
+# marked as recently seen, then times a batch of distinct exam versions.
+#
+# How to run:
+#   python benchmarks/bench_mock_exam.py
+#   python benchmarks/bench_mock_exam.py --bank-size 100000 --versions 5000
+
+import argparse
+import random
+import tempfile
+import time
+
+from synthetic import synthetic_bank
+
+from mock_exam import DEFAULT_BLUEPRINT, MockExamSampler
+from question_store import TopicIndex
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Cost of generating mock exam versions from a blueprint (mock_exam.py)."
+    )
+    parser.add_argument("--bank-size", type=int, default=30000)
+    parser.add_argument("--length", type=int, default=100)
+    parser.add_argument("--versions", type=int, default=2000)
+    parser.add_argument("--recent", type=float, default=0.1,
+                        help="share of the bank marked as recently seen")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bank = synthetic_bank(args.bank_size, tmp)
+        topic_index = TopicIndex(bank)
+        recent = random.Random(0).sample(range(len(bank)), int(len(bank) * args.recent))
+
+        start = time.perf_counter()
+        sampler = MockExamSampler(bank, topic_index, DEFAULT_BLUEPRINT, recent=recent)
+        setup_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        versions = sampler.versions(args.length, args.versions)
+        batch_s = time.perf_counter() - start
+
+        recent_set = set(recent)
+        repeats = sum(p in recent_set for _seed, positions in versions for p in positions)
+
+    print(f"bank size:        {args.bank_size} ({len(recent)} recently seen)")
+    print(f"pool setup:       {setup_s * 1000:.1f} ms")
+    print(f"{len(versions)} versions:   {batch_s * 1000:.0f} ms "
+          f"({batch_s / len(versions) * 1e6:.0f} us per {args.length}-question exam)")
+    print(f"recently seen questions drawn: {repeats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# benchmarks/bench_print_exams.py
+# Cost of rendering printable exam versions (print_exams.py).
+#
+# Renders a batch of shuffled versions of one paper from a synthetic bank,
+# in this process and then with a process pool, and reports the time per
+# version.
+#
+# How to run:
+#   python benchmarks/bench_print_exams.py
+#   python benchmarks/bench_print_exams.py --versions 500 --length 100 -j 8
+
+import argparse
+import os
+import tempfile
+import time
+
+from synthetic import synthetic_bank
+
+from print_exams import exam_versions, render_versions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Cost of rendering printable exam versions (print_exams.py)."
+    )
+    parser.add_argument("--bank-size", type=int, default=5000)
+    parser.add_argument("--versions", type=int, default=100)
+    parser.add_argument("--length", type=int, default=100)
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bank = synthetic_bank(args.bank_size, tmp)
+        paper = list(range(0, len(bank), len(bank) // args.length))[:args.length]
+        versions = exam_versions(paper, args.versions)
+
+        timings = {}
+        for workers in sorted({1, args.workers}):
+            start = time.perf_counter()
+            render_versions(bank, versions, os.path.join(tmp, f"out{workers}"), workers)
+            timings[workers] = time.perf_counter() - start
+
+    print(f"{args.versions} versions of {args.length} questions")
+    for workers, seconds in timings.items():
+        print(f"  {workers} process(es): {seconds:.1f} s "
+              f"({seconds / args.versions * 1000:.0f} ms per version)")
+
+
+if __name__ == "__main__":
+    main()
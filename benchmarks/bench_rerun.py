@@ -0,0 +1,138 @@
+# benchmarks/bench_rerun.py
+# Cost of one Streamlit script run per user action, end to end.
+#
+# Drives app.py headlessly with streamlit.testing's AppTest through
+#   load -> start quiz -> select option -> submit -> next -> finish -> summary
+# against synthetic banks of several sizes, and reports for every step the
+# wall time and process CPU time (medians over --repeat runs), how many
+# script runs the action cost (from the app's RunMetrics), the CPU time of the
+# question card alone, the traced peak memory and the net number of
+# allocated blocks left behind.
+#
+# AppTest always executes the whole script, even for widgets inside a
+# st.fragment, so "card cpu" is what the same click costs when the browser
+# triggers a fragment-only rerun of the question card.
+#
+# How to run:
+#   python benchmarks/bench_rerun.py
+#   python benchmarks/bench_rerun.py --sizes 300 3000 30000 --repeat 5
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from synthetic import ROOT, synthetic_bank
+
+from streamlit.testing.v1 import AppTest
+
+from progress_store import DB_PATH_ENV
+from question_store import BANK_PATH_ENV
+
+APP_PATH = os.path.join(ROOT, "app.py")
+
+
+def _button(at, label_prefix):
+    for button in list(at.button) + list(at.sidebar.button):
+        if button.label.startswith(label_prefix):
+            return button
+    raise LookupError(f"no button starting with {label_prefix!r}")
+
+
+def _metrics(at, name):
+    try:
+        return getattr(at.session_state["metrics"], name)
+    except KeyError:  # before the first run
+        return 0
+
+
+def _script_runs(at):
+    return _metrics(at, "script_runs")
+
+
+def _steps():
+    """
+    (name, action) pairs; each action takes the AppTest and performs exactly
+    one user interaction, including the script run(s) it triggers.
+    """
+    return [
+        ("load", lambda at: at.run()),
+        ("start quiz", lambda at: _button(at, "Start").click().run()),
+        ("select option", lambda at: at.radio[0].set_value(1).run()),
+        ("submit", lambda at: _button(at, "Submit answer").click().run()),
+        ("next", lambda at: _button(at, "Next question").click().run()),
+        ("finish", lambda at: _button(at, "⏹️ Finish quiz").click().run()),
+        ("summary rerun", lambda at: at.run()),
+    ]
+
+
+def run_flow(traced=False):
+    """
+    Run the whole flow once in a fresh session and return
+    {step: (seconds, cpu_seconds, script_runs, card_cpu_seconds,
+            peak_bytes, net_blocks)}.
+    """
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+    results = {}
+    for name, action in _steps():
+        runs_before = _script_runs(at)
+        if traced:
+            tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        action(at)
+        cpu = time.process_time() - cpu_start
+        elapsed = time.perf_counter() - start
+        peak = blocks = 0
+        if traced:
+            _current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            blocks = sum(s.count_diff for s in after.compare_to(before, "filename"))
+        if at.exception:
+            raise RuntimeError(f"step {name!r} raised: {at.exception[0].value}")
+        results[name] = (elapsed, cpu, _script_runs(at) - runs_before,
+                         _metrics(at, "last_card_seconds"), peak, blocks)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Cost of one Streamlit script run per user action, end to end."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[300, 3000, 30000],
+                        help="synthetic bank sizes")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="untraced runs per size (the median is reported)")
+    args = parser.parse_args(argv)
+
+    print(f"{'bank':>7}  {'step':<14}  {'wall ms':>8}  {'cpu ms':>7}  {'runs':>4}  "
+          f"{'card cpu ms':>11}  {'peak KiB':>9}  {'net blocks':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            bank = synthetic_bank(n, tmp)
+            os.environ[BANK_PATH_ENV] = bank.path
+            # synthetic ids overlap real ones: keep these answers out of progress.sqlite3
+            os.environ[DB_PATH_ENV] = os.path.join(tmp, f"progress_{n}.sqlite3")
+
+            # first flow warms the process-wide bank caches for this size
+            run_flow()
+            timed = [run_flow() for _ in range(args.repeat)]
+            traced = run_flow(traced=True)
+
+            for name, _action in _steps():
+                wall = statistics.median(r[name][0] for r in timed)
+                cpu = statistics.median(r[name][1] for r in timed)
+                card = statistics.median(r[name][3] for r in timed)
+                _elapsed, _cpu, runs, _card, peak, blocks = traced[name]
+                print(f"{n:>7}  {name:<14}  {wall * 1000:>8.1f}  {cpu * 1000:>7.1f}  {runs:>4}  "
+                      f"{card * 1000:>11.2f}  {peak / 1024:>9.0f}  {blocks:>10}")
+    os.environ.pop(BANK_PATH_ENV, None)
+    os.environ.pop(DB_PATH_ENV, None)
+
+
+if __name__ == "__main__":
+    main()
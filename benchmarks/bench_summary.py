@@ -0,0 +1,77 @@
+# benchmarks/bench_summary.py
+# Time and peak memory of the text and PDF session summaries.
+#
+# How to run:
+#   python benchmarks/bench_summary.py
+#   python benchmarks/bench_summary.py --sizes 300 5000 20000
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from io import BytesIO
+
+from synthetic import synthetic_bank, synthetic_responses
+
+import summary
+
+
+def _measure(fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+
+    # peak memory in a second, traced run (tracing slows the code down)
+    tracemalloc.start()
+    fn()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def _text(responses, bank):
+    out = summary.generate_text_summary(responses, bank)
+    return len(out.encode("utf-8")), None
+
+
+def _pdf(responses, bank):
+    buf = BytesIO()
+    pages = summary.write_pdf_summary(responses, bank, buf)
+    return len(buf.getvalue()), pages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Time and peak memory of the text and PDF session summaries."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[300, 5000],
+                        help="session sizes (number of answered questions)")
+    args = parser.parse_args(argv)
+
+    print(f"{'session':>8}  {'format':<6}  {'time (s)':>9}  {'peak MiB':>9}  {'size KiB':>9}  {'pages/s':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            bank = synthetic_bank(n, tmp)
+            responses = synthetic_responses(bank, n)
+
+            for name, render in (("text", _text), ("pdf", _pdf)):
+                size, pages = render(responses, bank)
+                elapsed, peak = _measure(lambda: render(responses, bank))
+                rate = f"{pages / elapsed:.1f}" if pages else ""
+                print(f"{n:>8}  {name:<6}  {elapsed:>9.3f}  {peak / 2**20:>9.1f}  "
+                      f"{size / 1024:>9.1f}  {rate:>8}")
+
+            # fixed date: the cache key includes the minute printed in the header
+            stamp = datetime.now()
+            start = time.perf_counter()
+            summary.cached_pdf_summary(responses, bank, stamp)
+            first = time.perf_counter() - start
+            start = time.perf_counter()
+            summary.cached_pdf_summary(responses, bank, stamp)
+            again = time.perf_counter() - start
+            print(f"{n:>8}  cached pdf: first {first:.3f}s, repeat {again * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
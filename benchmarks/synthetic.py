@@ -0,0 +1,83 @@
+# benchmarks/synthetic.py
+# Synthetic question banks and sessions for the benchmark scripts.
+
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from bank_format import CompiledBank, write_bank  # noqa: E402
+from responses import Response  # noqa: E402
+
+TOPICS = [
+    "ANS", "Anatomical Terms & Planes", "Cell Division & Early Embryology",
+    "Connective Tissue, Cartilage & Bone", "Endocrine System",
+    "Epithelium & Glands", "Female Reproductive System", "Heart & Blood Vessels",
+    "Joints & Muscle", "Lymphatic System", "Male Reproductive System",
+    "Membrane Transport", "Nervous System (CNS & PNS)", "Respiratory System",
+    "Urinary System",
+]
+
+TAGS = ["clinical", "embryology", "histology", "physiology"]
+
+_WORDS = (
+    "artery vein nerve muscle ligament tendon fascia cortex medulla epithelium "
+    "gland duct lumen membrane receptor plexus ganglion foramen fossa process "
+    "lateral medial anterior posterior superior inferior proximal distal deep "
+    "superficial ventral dorsal cranial caudal efferent afferent sympathetic"
+).split()
+
+
+def _sentence(rng, n_words):
+    words = [rng.choice(_WORDS) for _ in range(n_words)]
+    return " ".join(words).capitalize()
+
+
+def synthetic_questions(n, seed=0):
+    """
+    Return `n` question dicts shaped like the real bank (four options,
+    similar text lengths), spread evenly over the real topic names, each
+    with about one tag.
+    """
+    rng = random.Random(seed)
+    tag_rng = random.Random(seed + 1)  # separate stream: the text stays as before
+    return [
+        {
+            "id": i + 1,
+            "topic": TOPICS[i % len(TOPICS)],
+            "question": _sentence(rng, 14) + "?",
+            "options": [_sentence(rng, 6) for _ in range(4)],
+            "answer_index": rng.randrange(4),
+            "explanation": _sentence(rng, 35) + ".",
+            "tags": [t for t in TAGS if tag_rng.random() < 0.25],
+        }
+        for i in range(n)
+    ]
+
+
+def synthetic_bank(n, directory, seed=0):
+    """
+    Compile a synthetic bank of `n` questions into `directory` and open it.
+    """
+    path = os.path.join(directory, f"synthetic_{n}.bank")
+    if not os.path.exists(path):
+        write_bank(synthetic_questions(n, seed), path)
+    return CompiledBank(path)
+
+
+def synthetic_responses(bank, n, seed=0):
+    """
+    `n` Response records over the first `n` questions of `bank`, about 70%
+    of them correct.
+    """
+    rng = random.Random(seed)
+    responses = []
+    for pos in range(n):
+        answer = bank.answers[pos]
+        correct = rng.random() < 0.7
+        selected = answer if correct else (answer + rng.randrange(1, 4)) % 4
+        responses.append(Response(bank.ids[pos], selected, correct))
+    return responses
@@ -0,0 +1,114 @@
+# build_bank.py
+# Compile the source lists in questions.py into the runtime bank file.
+#
+# How to run:
+#   python build_bank.py              # writes questions.bank next to app.py
+#   python build_bank.py -o my.bank
+#   python build_bank.py --no-duplicates
+#
+# Every question is validated first (bank_validator.py); a bank with any
+# malformed question is not written. Questions are tagged by keyword on top
+# of any tags they list (question_tags.py). Run by hand, it also reports
+# clusters of near-duplicate questions across the source lists
+# (near_duplicates.py). The app runs the validate-and-compile step alone
+# automatically when questions.bank is missing or older than questions.py,
+# the tag rules or the build scripts (question_store.BUILD_INPUTS).
+
+import argparse
+import sys
+
+from bank_format import write_bank
+from bank_validator import BankValidationError, format_problem, validate
+from near_duplicates import THRESHOLD, find_near_duplicates
+from question_store import COMPILED_BANK_PATH
+from question_tags import with_default_tags
+
+
+def source_questions():
+    """
+    Return every question from questions.py, in bank order.
+    """
+    return [q for _name, _index, q in source_items()]
+
+
+def source_items():
+    """
+    (source list name, index in that list, question) for every question,
+    in bank order.
+    """
+    import questions
+
+    return [
+        (name, index, q)
+        for name, items in questions.SOURCE_LISTS
+        for index, q in enumerate(items)
+    ]
+
+
+def near_duplicate_report(items, threshold=THRESHOLD):
+    """
+    Report lines for clusters of near-duplicate questions among `items`
+    (as returned by source_items()).
+    """
+    clusters = find_near_duplicates([q for _name, _index, q in items], threshold=threshold)
+    lines = []
+    for n, cluster in enumerate(clusters, start=1):
+        lines.append(
+            f"Cluster {n}: {len(cluster.members)} questions, "
+            f"similarity up to {cluster.similarity:.2f}"
+        )
+        for pos in cluster.members:
+            name, index, q = items[pos]
+            lines.append(f"  {name}[{index}] id={q['id']} [{q['topic']}] {q['question'][:70]}")
+    return clusters, lines
+
+
+def build(path=COMPILED_BANK_PATH, items=None, workers=None):
+    """
+    Validate and compile the source lists (or `items`, as returned by
+    source_items()) to `path` and return the number of questions. Raises
+    BankValidationError, without writing anything, if a question is
+    malformed.
+    """
+    items = source_items() if items is None else items
+    problems = validate(items, workers=workers)
+    if problems:
+        raise BankValidationError(problems)
+    write_bank([with_default_tags(q) for _name, _index, q in items], path)
+    return len(items)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compile the source lists in questions.py into the runtime bank file."
+    )
+    parser.add_argument("-o", "--output", default=COMPILED_BANK_PATH,
+                        help="where to write the compiled bank")
+    parser.add_argument("--no-duplicates", action="store_true",
+                        help="skip the near-duplicate report")
+    parser.add_argument("--duplicate-threshold", type=float, default=THRESHOLD,
+                        help="estimated Jaccard similarity that counts as a near duplicate")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="processes used to validate large banks (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    items = source_items()
+    try:
+        count = build(args.output, items, workers=args.workers)
+    except BankValidationError as exc:
+        for problem in exc.problems:
+            print(format_problem(problem), file=sys.stderr)
+        print(f"Not written: {len(exc.problems)} problem(s) in the question bank.",
+              file=sys.stderr)
+        return 1
+    print(f"Wrote {count} questions to {args.output}")
+
+    if not args.no_duplicates:
+        clusters, lines = near_duplicate_report(items, args.duplicate_threshold)
+        print(f"Near-duplicate clusters: {len(clusters)}")
+        for line in lines:
+            print(line)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+# client_grader.py
+# Optional browser-side grading for the Anatomy MCQ Trainer.
+#
+# In "Browser-graded batches" mode a whole batch of questions (options in
+# display order, the correct display index and the explanation) is sent to a
+# small custom component once. The student answers and sees feedback in the
+# browser with no server round trips, and the component uploads every answer
+# of the batch in a single message at the end.
+#
+# Shipping answers to the browser means a determined student can read them,
+# so this mode is meant for self-study, not assessment. Uploaded answers are
+# re-graded on the server, so the recorded results are authoritative, and
+# their timestamps are only kept when they agree with the server clock.
+
+import math
+import os
+import time
+
+import streamlit.components.v1 as components
+
+_FRONTEND_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "frontend", "client_grader"
+)
+_component = components.declare_component("client_grader", path=_FRONTEND_DIR)
+
+# browser timestamps are only trusted this close to the server clock (a batch
+# can stay open a while, a clock can be a little ahead); anything else is
+# replaced by the server time of the upload
+MAX_ANSWER_AGE = 6 * 3600  # seconds
+MAX_CLOCK_AHEAD = 60  # seconds
+
+
+def batch_id(quiz):
+    """Identifies the batch starting at the current question of this quiz."""
+    _topic, seed, _shuffled = quiz.order.state()
+    return f"{seed:x}-{quiz.current_index}"
+
+
+def batch_payload(quiz, size):
+    """
+    Everything the browser needs to grade the next `size` questions.
+    """
+    questions = []
+    for pos, q in quiz.page(size):
+        order = quiz.option_order(q)
+        questions.append({
+            "position": pos,
+            "id": q["id"],
+            "topic": q["topic"],
+            "question": q["question"],
+            "options": [q["options"][orig_idx] for orig_idx in order],
+            "correct": order.index(q["answer_index"]),
+            "explanation": q["explanation"],
+        })
+    return {"id": batch_id(quiz), "total": len(quiz), "questions": questions}
+
+
+def client_grader(quiz, size, key, on_change=None):
+    """
+    Render the component for the next batch. Returns the uploaded value
+    ({"batch", "answers", "answered_at"}) once the batch is finished, else None.
+    """
+    return _component(batch=batch_payload(quiz, size), key=key, on_change=on_change)
+
+
+def _answer_time(ts, now=None):
+    """
+    Unix time of an uploaded answer timestamp (milliseconds since the
+    epoch), or None (server time) unless it is a finite number within
+    MAX_ANSWER_AGE before and MAX_CLOCK_AHEAD after the server clock.
+    """
+    if type(ts) not in (int, float) or not math.isfinite(ts):
+        return None
+    now = time.time() if now is None else now
+    ts = ts / 1000
+    if not now - MAX_ANSWER_AGE <= ts <= now + MAX_CLOCK_AHEAD:
+        return None
+    return ts
+
+
+def apply_upload(quiz, size, value):
+    """
+    Record an uploaded batch on `quiz` and move on to the next one.
+
+    Uploads for any other batch (e.g. a stale value from before a restart)
+    are ignored. Returns True if the batch was recorded.
+    """
+    if not value or value.get("batch") != batch_id(quiz):
+        return False
+
+    page = quiz.page(size)
+    uploaded = list(value.get("answers") or [])
+    uploaded += [None] * (len(page) - len(uploaded))
+    # anything that is not a valid display index counts as not answered
+    answers = [
+        a if type(a) is int and 0 <= a < len(q["options"]) else None
+        for a, (_pos, q) in zip(uploaded, page)
+    ]
+    timestamps = value.get("answered_at")
+    answered_at = [_answer_time(ts) for ts in timestamps] if isinstance(timestamps, list) else []
+
+    quiz.answer_page(size, answers, answered_at)
+    quiz.next_page(size)
+    return True
@@ -0,0 +1,78 @@
+# instrumentation.py
+# Lightweight run/action counters for the Anatomy MCQ Trainer.
+#
+# Every Streamlit script run and every user action (a widget callback) is
+# counted, per session and for the whole process. The ratio of the two,
+# reruns per user action, should stay at 1.0: anything above it means some
+# interaction is executing the script more than once. Fragment-only runs of
+# the question card are counted separately from full script runs, together
+# with the CPU time the card itself takes.
+
+import threading
+from collections import Counter
+
+
+class RunMetrics:
+    """
+    Script runs and user actions seen by one session (or the process).
+    """
+
+    def __init__(self):
+        self.page_loads = 0
+        self.script_runs = 0
+        self.fragment_runs = 0
+        self.card_seconds = 0.0
+        self.last_card_seconds = 0.0
+        self.user_actions = 0
+        self.actions = Counter()
+        self._lock = threading.Lock()
+
+    def record_run(self, page_load=False):
+        with self._lock:
+            self.script_runs += 1
+            if page_load:
+                self.page_loads += 1
+
+    def record_fragment_run(self):
+        with self._lock:
+            self.fragment_runs += 1
+
+    def record_card_time(self, seconds):
+        with self._lock:
+            self.card_seconds += seconds
+            self.last_card_seconds = seconds
+
+    def record_action(self, name):
+        with self._lock:
+            self.user_actions += 1
+            self.actions[name] += 1
+
+    @property
+    def runs_per_action(self):
+        """
+        Runs (full or fragment-only) per user action, not counting page
+        loads, which run the script without any action.
+        """
+        if not self.user_actions:
+            return 0.0
+        return (self.script_runs + self.fragment_runs - self.page_loads) / self.user_actions
+
+    @property
+    def full_runs_per_action(self):
+        """Like runs_per_action, but counting only full script runs."""
+        if not self.user_actions:
+            return 0.0
+        return (self.script_runs - self.page_loads) / self.user_actions
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+# shared by every session in this process
+PROCESS_METRICS = RunMetrics()
@@ -0,0 +1,202 @@
+# irt.py
+# Computerized-adaptive testing for the Anatomy MCQ Trainer.
+#
+# Items follow the two-parameter logistic (2PL) model: the chance of a correct
+# answer at ability theta is 1 / (1 + exp(-a * (theta - b))), with
+# discrimination a and difficulty b per bank position. Both are calibrated in
+# bulk from the logged responses (progress_store.ProgressStore.item_responses()).
+#
+# During an adaptive quiz the student's ability is an EAP estimate over a
+# fixed quadrature grid, and each next question is the unseen item with the
+# most Fisher information at that estimate. Both steps are NumPy operations
+# over the whole candidate set, so a pick stays well under a millisecond at
+# 30k items.
+
+import threading
+import time
+
+import numpy as np
+
+from quiz_order import DynamicOrder
+
+# fixed prior for uncalibrated items
+DEFAULT_DISCRIMINATION = 1.0
+DEFAULT_DIFFICULTY = 0.0
+MIN_DISCRIMINATION = 0.2
+MAX_DISCRIMINATION = 3.0
+MAX_DIFFICULTY = 4.0
+
+# ability quadrature grid with a standard normal prior
+THETA_GRID = np.linspace(-4.0, 4.0, 81)
+THETA_PRIOR = np.exp(-0.5 * THETA_GRID ** 2)
+
+# pick at random among the most informative few, so students at the same
+# ability don't all see the same sequence
+TOP_K = 5
+
+CALIBRATION_MAX_AGE = 600  # seconds
+
+
+class ItemParameters:
+    """
+    2PL discrimination (a) and difficulty (b) for every bank position.
+    """
+
+    def __init__(self, a, b, n_responses):
+        self.a = a
+        self.b = b
+        self.n_responses = n_responses
+
+    @classmethod
+    def uncalibrated(cls, size):
+        return cls(
+            np.full(size, DEFAULT_DISCRIMINATION),
+            np.full(size, DEFAULT_DIFFICULTY),
+            np.zeros(size, dtype=np.int64),
+        )
+
+    @classmethod
+    def calibrate(cls, bank, rows):
+        """
+        Estimate item parameters from (question_id, person, correct) rows.
+
+        Difficulty comes from each item's smoothed proportion correct,
+        discrimination from its point-biserial correlation with the person's
+        overall proportion correct (the usual normal-ogive approximations).
+        Rows for questions no longer in the bank are ignored.
+        """
+        params = cls.uncalibrated(len(bank))
+        if not rows:
+            return params
+
+        qids, persons, correct = zip(*rows)
+        positions = _positions_of(bank, np.array(qids, dtype=np.int64))
+        known = positions >= 0
+        positions = positions[known]
+        x = np.array(correct, dtype=np.float64)[known]
+        _, person_idx = np.unique(np.array(persons, dtype=object)[known].astype(str),
+                                  return_inverse=True)
+
+        # each person's overall proportion correct
+        person_n = np.bincount(person_idx)
+        y = (np.bincount(person_idx, weights=x) / person_n)[person_idx]
+
+        size = len(bank)
+        n = np.bincount(positions, minlength=size).astype(np.float64)
+        sx = np.bincount(positions, weights=x, minlength=size)
+        sy = np.bincount(positions, weights=y, minlength=size)
+        sxy = np.bincount(positions, weights=x * y, minlength=size)
+        syy = np.bincount(positions, weights=y * y, minlength=size)
+
+        seen = n > 0
+        p = (sx + 1.0) / (n + 2.0)  # Laplace-smoothed proportion correct
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = sxy / n - (sx / n) * (sy / n)
+            var_x = sx / n - (sx / n) ** 2
+            var_y = syy / n - (sy / n) ** 2
+            r = cov / np.sqrt(var_x * var_y)
+        usable = seen & np.isfinite(r) & (n >= 5)
+        r = np.clip(np.where(usable, r, 0.0), 0.0, 0.95)
+
+        a = np.where(usable, 1.7 * r / np.sqrt(1.0 - r ** 2), DEFAULT_DISCRIMINATION)
+        a = np.clip(a, MIN_DISCRIMINATION, MAX_DISCRIMINATION)
+        b = np.where(seen, -np.log(p / (1.0 - p)) / a, DEFAULT_DIFFICULTY)
+        params.a = a
+        params.b = np.clip(b, -MAX_DIFFICULTY, MAX_DIFFICULTY)
+        params.n_responses = n.astype(np.int64)
+        return params
+
+
+def _positions_of(bank, qids):
+    """Bank positions of an array of question ids (-1 where unknown)."""
+    ids = np.asarray(bank.ids, dtype=np.int64)
+    by_id = np.argsort(ids)
+    found = np.searchsorted(ids, qids, sorter=by_id)
+    found = np.minimum(found, len(ids) - 1)
+    positions = by_id[found]
+    return np.where(ids[positions] == qids, positions, -1)
+
+
+_calibrations = {}
+_calibration_lock = threading.Lock()
+
+
+def item_parameters(bank, store=None, max_age=CALIBRATION_MAX_AGE):
+    """
+    Process-wide item parameters for `bank`, recalibrated from `store` at
+    most every `max_age` seconds.
+    """
+    key = (bank.path, id(store))
+    with _calibration_lock:
+        cached = _calibrations.get(key)
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+        rows = store.item_responses() if store is not None else ()
+        params = ItemParameters.calibrate(bank, rows)
+        _calibrations[key] = (time.monotonic(), params)
+        return params
+
+
+class AbilityEstimate:
+    """
+    EAP ability estimate: a posterior over THETA_GRID updated per answer.
+    """
+
+    def __init__(self):
+        self.log_posterior = np.log(THETA_PRIOR)
+
+    def update(self, a, b, correct):
+        p = 1.0 / (1.0 + np.exp(-a * (THETA_GRID - b)))
+        self.log_posterior += np.log(p if correct else 1.0 - p)
+
+    def _posterior(self):
+        w = np.exp(self.log_posterior - self.log_posterior.max())
+        return w / w.sum()
+
+    @property
+    def theta(self):
+        return float(self._posterior() @ THETA_GRID)
+
+    @property
+    def standard_error(self):
+        w = self._posterior()
+        mean = w @ THETA_GRID
+        return float(np.sqrt(w @ (THETA_GRID - mean) ** 2))
+
+
+class AdaptiveOrder(DynamicOrder):
+    """
+    Question order of an adaptive quiz of up to `length` questions.
+
+    A dynamic order (see quiz_order.DynamicOrder): order[i] selects the
+    unseen item with the most information at the current ability estimate,
+    which each first answer updates.
+    """
+
+    def __init__(self, topic_index, params, length, topic=None, seed=0, positions=None):
+        self.params = params
+        self.ability = AbilityEstimate()
+        if positions is None:
+            positions = topic_index.positions(topic)
+        self._candidates = np.asarray(positions, dtype=np.int64)
+        self._a = params.a[self._candidates]
+        self._b = params.b[self._candidates]
+        self._available = np.ones(len(self._candidates), dtype=bool)
+        self._rng = np.random.default_rng(seed)
+        super().__init__(topic, seed, min(length, len(self._candidates)))
+
+    def information(self, theta):
+        """Fisher information of every candidate item at `theta`."""
+        p = 1.0 / (1.0 + np.exp(-self._a * (theta - self._b)))
+        return self._a ** 2 * p * (1.0 - p)
+
+    def _pick(self):
+        info = np.where(self._available, self.information(self.ability.theta), -1.0)
+        k = min(TOP_K, int(self._available.sum()))
+        best = np.argpartition(info, -k)[-k:]
+        choice = best[self._rng.integers(k)]
+        self._available[choice] = False
+        return int(self._candidates[choice])
+
+    def _update(self, pos, resp):
+        self.ability.update(self.params.a[pos], self.params.b[pos], resp.correct)
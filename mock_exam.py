@@ -0,0 +1,220 @@
+# mock_exam.py
+# Stratified mock exams assembled from a topic blueprint.
+#
+# A blueprint maps topic names to their share of the paper (percentages, or
+# any positive weights). allocate() turns it into per-topic question counts
+# by largest remainder, capped at what each topic has, and an exam draws
+# that many questions from each topic without replacement. Questions the
+# user has answered recently are only drawn once a topic runs out of fresh
+# ones.
+#
+# The per-topic pools are built once per MockExamSampler; after that an
+# exam is one random.sample() per topic, so a batch job can produce
+# thousands of versions for a cohort in about a second. Each version is a
+# pure function of (blueprint, length, seed) and can be rebuilt from its
+# seed.
+#
+# How to run (batch job, one CSV row per question):
+#   python mock_exam.py --versions 2000 --length 100 -o versions.csv
+#   python mock_exam.py --blueprint blueprint.json --versions 300
+
+import argparse
+import csv
+import json
+import random
+import sys
+import time
+
+import numpy as np
+
+# percentage of the paper per topic; topics left out get no questions
+DEFAULT_BLUEPRINT = {
+    "Anatomical Terms & Planes": 10,
+    "Heart & Blood Vessels": 15,
+    "Nervous System (CNS & PNS)": 8,
+    "Joints & Muscle": 8,
+    "Connective Tissue, Cartilage & Bone": 8,
+    "ANS": 6,
+    "Endocrine System": 6,
+    "Epithelium & Glands": 6,
+    "Cell Division & Early Embryology": 5,
+    "Lymphatic System": 5,
+    "Membrane Transport": 5,
+    "Respiratory System": 5,
+    "Urinary System": 5,
+    "Female Reproductive System": 4,
+    "Male Reproductive System": 4,
+}
+
+# answers given within this many days count as recently seen
+RECENT_DAYS = 14
+
+
+def allocate(blueprint, length, available):
+    """
+    {topic: question count} for a `length`-question paper: each topic gets
+    its blueprint share by largest remainder, capped at available[topic];
+    a capped topic's shortfall is shared out among the others the same way.
+    Sums to `length`, or to everything available if that is less.
+    """
+    counts = {t: 0 for t, w in blueprint.items() if w > 0 and available.get(t, 0) > 0}
+    remaining = min(length, sum(available[t] for t in counts))
+    open_topics = list(counts)
+    while remaining > 0 and open_topics:
+        total = sum(blueprint[t] for t in open_topics)
+        quotas = {t: remaining * blueprint[t] / total for t in open_topics}
+        grant = {t: min(int(quotas[t]), available[t] - counts[t]) for t in open_topics}
+        leftover = remaining - sum(grant.values())
+        # the seats left by rounding down go to the largest fractions
+        by_fraction = sorted(open_topics, key=lambda t: (int(quotas[t]) - quotas[t], t))
+        for t in by_fraction:
+            if not leftover:
+                break
+            if counts[t] + grant[t] < available[t]:
+                grant[t] += 1
+                leftover -= 1
+        for t, n in grant.items():
+            counts[t] += n
+        remaining = leftover
+        open_topics = [t for t in open_topics if counts[t] < available[t]]
+    return counts
+
+
+def available_counts(bank, topic_index, topic=None, positions=None):
+    """
+    {topic: questions available} for an exam over `positions` (if given),
+    else over `topic` (None = every topic), for allocate(). Uses the topic
+    index and a bincount, so it costs no per-question Python work.
+    """
+    if positions is not None:
+        topic_ids = np.asarray(bank.topic_ids)[np.asarray(positions, dtype=np.intp)]
+        counts = np.bincount(topic_ids, minlength=len(bank.topics))
+        return dict(zip(bank.topics, counts.tolist()))
+    if topic is not None:
+        return {topic: topic_index.count(topic)}
+    return {t: topic_index.count(t) for t in topic_index.topics}
+
+
+def recent_positions(bank, store, user_name, days=RECENT_DAYS, now=None):
+    """
+    Bank positions of the questions `user_name` answered in the last
+    `days` days, according to the progress store.
+    """
+    now = time.time() if now is None else now
+    positions = []
+    for question_id in store.recent_question_ids(user_name, now - days * 86400):
+        try:
+            positions.append(bank.position_of(question_id))
+        except KeyError:
+            continue  # no longer in the bank
+    return positions
+
+
+class MockExamSampler:
+    """
+    Draws mock exams from `topic_index` (or only from explicit `positions`)
+    to `blueprint`. `recent` is the bank positions the user has seen
+    recently; they are drawn only when a topic has no fresh ones left.
+    """
+
+    def __init__(self, bank, topic_index, blueprint=DEFAULT_BLUEPRINT, recent=(), positions=None):
+        recent = set(recent)
+        if positions is None:
+            groups = {t: topic_index.positions(t) for t in blueprint}
+        else:
+            groups = {}
+            for pos in positions:
+                groups.setdefault(bank.topics[bank.topic_ids[pos]], []).append(pos)
+        self.blueprint = {t: w for t, w in blueprint.items() if w > 0 and groups.get(t)}
+        self._fresh = {}
+        self._seen = {}
+        for topic in self.blueprint:
+            members = groups[topic]
+            self._fresh[topic] = [p for p in members if p not in recent]
+            self._seen[topic] = [p for p in members if p in recent]
+        self.available = {t: len(groups[t]) for t in self.blueprint}
+        self._counts = {}
+
+    def counts(self, length):
+        """{topic: questions} for a `length`-question exam (see allocate())."""
+        if length not in self._counts:
+            self._counts[length] = allocate(self.blueprint, length, self.available)
+        return self._counts[length]
+
+    def exam(self, length, seed):
+        """Bank positions of one exam, ascending."""
+        rng = random.Random(seed)
+        picked = []
+        for topic, k in self.counts(length).items():
+            fresh = self._fresh[topic]
+            if k <= len(fresh):
+                picked += rng.sample(fresh, k)
+            else:
+                picked += fresh
+                picked += rng.sample(self._seen[topic], k - len(fresh))
+        picked.sort()
+        return picked
+
+    def versions(self, length, count, seed=0):
+        """
+        `count` distinct exams as (seed, positions) pairs. A draw that
+        repeats an earlier version's question set is replaced by the next
+        seed; raises ValueError if the pools are too small to give `count`
+        different exams.
+        """
+        found = []
+        seen = set()
+        attempt = seed
+        while len(found) < count:
+            if attempt - seed >= 10 * count + 100:
+                raise ValueError(f"only {len(found)} distinct exams of {length} questions found")
+            positions = self.exam(length, attempt)
+            key = tuple(positions)
+            if key not in seen:
+                seen.add(key)
+                found.append((attempt, positions))
+            attempt += 1
+        return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Stratified mock exams assembled from a topic blueprint."
+    )
+    parser.add_argument("--blueprint", help="JSON file of {topic: share} (default: DEFAULT_BLUEPRINT)")
+    parser.add_argument("--length", type=int, default=100, help="questions per exam")
+    parser.add_argument("--versions", type=int, default=100, help="number of distinct exams")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first version")
+    parser.add_argument("-o", "--output", help="CSV file to write (default: stdout)")
+    args = parser.parse_args(argv)
+
+    from question_store import load_question_bank, load_topic_index
+
+    blueprint = DEFAULT_BLUEPRINT
+    if args.blueprint:
+        with open(args.blueprint, encoding="utf-8") as f:
+            blueprint = json.load(f)
+    bank = load_question_bank()
+    sampler = MockExamSampler(bank, load_topic_index(), blueprint)
+    try:
+        versions = sampler.versions(args.length, args.versions, args.seed)
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+
+    out = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    try:
+        writer = csv.writer(out)
+        writer.writerow(["version", "seed", "question_id", "topic"])
+        for version, (seed, positions) in enumerate(versions, start=1):
+            for pos in positions:
+                writer.writerow([version, seed, bank.ids[pos], bank.topics[bank.topic_ids[pos]]])
+    finally:
+        if args.output:
+            out.close()
+    counts = ", ".join(f"{t} {n}" for t, n in sampler.counts(args.length).items())
+    print(f"{len(versions)} versions of {args.length} questions ({counts})", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+# near_duplicates.py
+# Near-duplicate question detection for the bank build (build_bank.py).
+#
+# The bank is concatenated from separately authored lists, so the same
+# question can turn up twice with slightly different wording. Comparing
+# every pair is quadratic; instead each question is reduced to a MinHash
+# signature of its stem word pairs and options, and locality-sensitive
+# hashing (banding the signatures) yields the few candidate pairs worth
+# checking. Candidates whose estimated Jaccard similarity clears the
+# threshold are grouped into clusters.
+
+import zlib
+from collections import namedtuple
+
+import numpy as np
+
+from search_index import tokenize
+
+NUM_PERM = 128
+BANDS = 32  # 4 rows per band: pairs at Jaccard 0.5 become candidates ~87% of the time
+THRESHOLD = 0.5
+# buckets holding more questions than this (boilerplate shared by many
+# items) only link neighbours, not every pair
+MAX_BUCKET = 50
+
+_PRIME = (1 << 31) - 1
+_EMPTY = np.iinfo(np.uint64).max
+
+# members are bank positions in ascending order; similarity is the highest
+# estimated Jaccard similarity between two of them
+NearDuplicateCluster = namedtuple("NearDuplicateCluster", "members similarity")
+
+
+def shingles(question):
+    """
+    Hashed shingles of a question: word pairs of its stem plus each option
+    as a whole, after the same normalisation as search.
+    """
+    stem = tokenize(question["question"])
+    items = [f"{a} {b}" for a, b in zip(stem, stem[1:])] or stem
+    items += ["option:" + " ".join(tokenize(option)) for option in question["options"]]
+    return np.array(sorted({zlib.crc32(s.encode()) for s in items}), dtype=np.uint64)
+
+
+def signatures(questions, num_perm=NUM_PERM, seed=0):
+    """MinHash signatures, one row of `num_perm` values per question."""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _PRIME, num_perm, dtype=np.uint64)[:, None]
+    b = rng.integers(0, _PRIME, num_perm, dtype=np.uint64)[:, None]
+    sigs = np.full((len(questions), num_perm), _EMPTY, dtype=np.uint64)
+    for i, q in enumerate(questions):
+        x = shingles(q)
+        if len(x):
+            # a * x stays below 2**63 for 31-bit a and 32-bit x
+            sigs[i] = ((a * x + b) % _PRIME).min(axis=1)
+    return sigs
+
+
+def candidate_pairs(sigs, bands=BANDS):
+    """
+    (i, j) index arrays of questions sharing at least one LSH band bucket.
+    """
+    n, num_perm = sigs.shape
+    rows = num_perm // bands
+    valid = sigs[:, 0] != _EMPTY
+    mult = np.random.default_rng(1).integers(1, 1 << 63, rows, dtype=np.uint64)
+    pairs = set()
+    for band in range(bands):
+        # fold the band's rows into one 64-bit bucket key (wrapping arithmetic)
+        keys = (sigs[:, band * rows:(band + 1) * rows] * mult).sum(axis=1, dtype=np.uint64)
+        order = np.argsort(keys[valid], kind="stable")
+        idx = np.flatnonzero(valid)[order]
+        sorted_keys = keys[idx]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        ends = np.r_[starts[1:], len(idx)]
+        for start, end in zip(starts, ends):
+            if end - start < 2:
+                continue
+            members = idx[start:end].tolist()
+            if len(members) > MAX_BUCKET:
+                pairs.update(zip(members, members[1:]))
+            else:
+                pairs.update(
+                    (p, q) for k, p in enumerate(members) for q in members[k + 1:]
+                )
+    if not pairs:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    i, j = np.array(sorted(pairs), dtype=np.intp).T
+    return i, j
+
+
+def find_near_duplicates(questions, threshold=THRESHOLD, num_perm=NUM_PERM, bands=BANDS):
+    """
+    Clusters of near-duplicate questions (estimated Jaccard similarity of
+    their shingles >= `threshold`), largest first.
+    """
+    sigs = signatures(questions, num_perm)
+    i, j = candidate_pairs(sigs, bands)
+    similarity = (sigs[i] == sigs[j]).mean(axis=1)
+    keep = similarity >= threshold
+    i, j, similarity = i[keep], j[keep], similarity[keep]
+
+    # union-find over the confirmed pairs
+    parent = {}
+
+    def root(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for p, q in zip(i.tolist(), j.tolist()):
+        parent[root(p)] = root(q)
+
+    groups, best = {}, {}
+    for p, q, s in zip(i.tolist(), j.tolist(), similarity.tolist()):
+        r = root(p)
+        groups.setdefault(r, set()).update((p, q))
+        best[r] = max(best.get(r, 0.0), s)
+    clusters = [NearDuplicateCluster(sorted(m), best[r]) for r, m in groups.items()]
+    clusters.sort(key=lambda c: (-len(c.members), -c.similarity, c.members[0]))
+    return clusters
@@ -0,0 +1,233 @@
+# print_exams.py
+# Printable exam versions with answer keys, for paper-based sessions.
+#
+# Every version is the same paper (or, with --distinct, its own draw from
+# the blueprint; see mock_exam.py) with its own question order and option
+# order: a QuizOrder over the paper's positions seeded per version, so a
+# version can be rebuilt from the paper and its seed alone. Each version is
+# written as a question booklet and a one-page answer key (fpdf2, with the
+# text helpers from summary.py), and every key also goes into
+# answer_keys.csv.
+#
+# Rendering is nearly all of the cost and versions are independent, so they
+# are rendered in worker processes that map the bank themselves: only
+# (number, seed, positions) goes out to a worker and the key rows come back.
+#
+# How to run:
+#   python print_exams.py --versions 500 --length 100 -o exams
+#   python print_exams.py --versions 40 --distinct --blueprint blueprint.json -j 4
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from fpdf import FPDF
+
+from mock_exam import DEFAULT_BLUEPRINT, MockExamSampler
+from question_store import load_question_bank, load_topic_index
+from quiz_order import QuizOrder
+from summary import pdf_text, wrap_text
+
+# positions is the paper as bank positions; the version's question and
+# option order both follow from seed
+ExamVersion = namedtuple("ExamVersion", "number seed positions")
+
+DEFAULT_TITLE = "Anatomy Mock Exam"
+LINE_HEIGHT = 5  # mm
+
+
+def exam_versions(paper, count, seed=0):
+    """`count` ExamVersions of one paper (bank positions), seeds seed, seed+1, ..."""
+    return [ExamVersion(n, seed + n - 1, paper) for n in range(1, count + 1)]
+
+
+def version_items(bank, version):
+    """
+    The questions of `version` in print order, as (question_id, stem,
+    options in print order, answer letter) tuples.
+    """
+    order = QuizOrder(None, None, version.seed, positions=version.positions)
+    items = []
+    for pos in order:
+        q = bank[pos]
+        display = order.option_order(q["id"], len(q["options"]))
+        options = [q["options"][i] for i in display]
+        answer = chr(65 + display.index(q["answer_index"]))
+        items.append((q["id"], q["question"], options, answer))
+    return items
+
+
+class _VersionPDF(FPDF):
+    """A4 page with the version number and page number in the footer."""
+
+    def __init__(self, footer_text):
+        super().__init__(format="A4")
+        self.footer_text = footer_text
+        self.set_auto_page_break(True, margin=15)
+
+    def footer(self):
+        self.set_y(-12)
+        self.set_font("Helvetica", "", 8)
+        self.cell(0, 5, f"{self.footer_text} - page {self.page_no()}", align="C")
+
+
+def write_exam_pdf(items, version, fp, title=DEFAULT_TITLE):
+    """
+    Render the question booklet of `version` (its version_items()) into the
+    binary file-like object `fp` and return the number of pages. A question
+    is never split across two pages.
+    """
+    pdf = _VersionPDF(f"{pdf_text(title)} - version {version.number}")
+    pdf.set_title(f"{title} - version {version.number}")
+    pdf.add_page()
+    pdf.set_font("Helvetica", "B", 16)
+    pdf.cell(0, 10, pdf_text(f"{title} - Version {version.number}"),
+             new_x="LMARGIN", new_y="NEXT")
+    pdf.set_font("Helvetica", "", 11)
+    pdf.cell(0, 8, "Name: ______________________________    Candidate no.: ____________",
+             new_x="LMARGIN", new_y="NEXT")
+    pdf.cell(0, 6, f"{len(items)} questions. Choose the single best answer to each.",
+             new_x="LMARGIN", new_y="NEXT")
+    pdf.ln(4)
+
+    pdf.set_font("Helvetica", "", 10)
+    indent = 6
+    width = pdf.epw - 2 * pdf.c_margin
+    for number, (_qid, stem, options, _answer) in enumerate(items, start=1):
+        # wrap the whole block first, so it can move to a new page intact
+        lines = [(0, line) for line in wrap_text(pdf, pdf_text(f"{number}. {stem}"), width)]
+        for k, option in enumerate(options):
+            text = pdf_text(f"{chr(65 + k)}) {option}")
+            lines.extend((indent, line) for line in wrap_text(pdf, text, width - indent))
+        if pdf.get_y() + len(lines) * LINE_HEIGHT > pdf.page_break_trigger:
+            pdf.add_page()
+        for x, line in lines:
+            pdf.set_x(pdf.l_margin + x)
+            pdf.cell(pdf.epw - x, LINE_HEIGHT, line, new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(3)
+
+    pdf.output(fp)
+    return pdf.page
+
+
+def write_key_pdf(items, version, fp, title=DEFAULT_TITLE, columns=5):
+    """Render the answer key of `version` into `fp`, `columns` answers per row."""
+    pdf = _VersionPDF(f"{pdf_text(title)} - answer key, version {version.number}")
+    pdf.set_title(f"{title} - answer key, version {version.number}")
+    pdf.add_page()
+    pdf.set_font("Helvetica", "B", 16)
+    pdf.cell(0, 10, pdf_text(f"{title} - Answer key, Version {version.number}"),
+             new_x="LMARGIN", new_y="NEXT")
+    pdf.ln(2)
+    pdf.set_font("Helvetica", "", 11)
+    cell_width = pdf.epw / columns
+    for start in range(0, len(items), columns):
+        for number in range(start + 1, min(start + columns, len(items)) + 1):
+            pdf.cell(cell_width, 7, f"{number}. {items[number - 1][3]}")
+        pdf.ln(7)
+    pdf.output(fp)
+    return pdf.page
+
+
+def _file_names(out_dir, version):
+    return (
+        os.path.join(out_dir, f"exam_v{version.number:03d}.pdf"),
+        os.path.join(out_dir, f"key_v{version.number:03d}.pdf"),
+    )
+
+
+def render_version(bank_path, version, out_dir, title=DEFAULT_TITLE):
+    """
+    Write the booklet and answer key PDFs of one version into `out_dir` and
+    return its key as (version, number, question_id, answer) rows. Runs in
+    worker processes, so it opens the bank itself.
+    """
+    bank = load_question_bank(bank_path)
+    items = version_items(bank, version)
+    exam_path, key_path = _file_names(out_dir, version)
+    with open(exam_path, "wb") as f:
+        write_exam_pdf(items, version, f, title)
+    with open(key_path, "wb") as f:
+        write_key_pdf(items, version, f, title)
+    return [
+        (version.number, number, qid, answer)
+        for number, (qid, _stem, _options, answer) in enumerate(items, start=1)
+    ]
+
+
+def _render_chunk(args):
+    bank_path, versions, out_dir, title = args
+    return [row for version in versions for row in render_version(bank_path, version, out_dir, title)]
+
+
+def render_versions(bank, versions, out_dir, workers=None, title=DEFAULT_TITLE):
+    """
+    Render every version into `out_dir`, in `workers` processes (default:
+    one per CPU; 1 renders in this process), write answer_keys.csv there
+    and return the number of versions written.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(versions) > 1:
+        # a few chunks per worker keeps them all busy to the end without
+        # paying the pickling round trip once per version
+        size = max(1, len(versions) // (workers * 4))
+        chunks = [
+            (bank.path, versions[i:i + size], out_dir, title)
+            for i in range(0, len(versions), size)
+        ]
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            key_rows = [row for rows in pool.map(_render_chunk, chunks) for row in rows]
+    else:
+        key_rows = _render_chunk((bank.path, versions, out_dir, title))
+
+    with open(os.path.join(out_dir, "answer_keys.csv"), "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["version", "number", "question_id", "answer"])
+        writer.writerows(key_rows)
+    return len(versions)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Printable exam versions with answer keys, for paper-based sessions."
+    )
+    parser.add_argument("--versions", type=int, default=10, help="number of exam versions")
+    parser.add_argument("--length", type=int, default=100, help="questions per paper")
+    parser.add_argument("--blueprint", help="JSON file of {topic: share} (default: DEFAULT_BLUEPRINT)")
+    parser.add_argument("--distinct", action="store_true",
+                        help="draw a different question set for every version")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the paper and first version")
+    parser.add_argument("--title", default=DEFAULT_TITLE)
+    parser.add_argument("-o", "--output", default="exams", help="directory to write the PDFs to")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="rendering processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    blueprint = DEFAULT_BLUEPRINT
+    if args.blueprint:
+        with open(args.blueprint, encoding="utf-8") as f:
+            blueprint = json.load(f)
+    bank = load_question_bank()
+    sampler = MockExamSampler(bank, load_topic_index(), blueprint)
+    if args.distinct:
+        try:
+            drawn = sampler.versions(args.length, args.versions, args.seed)
+        except ValueError as exc:
+            print(exc, file=sys.stderr)
+            return 1
+        versions = [ExamVersion(n, seed, paper) for n, (seed, paper) in enumerate(drawn, start=1)]
+    else:
+        versions = exam_versions(sampler.exam(args.length, args.seed), args.versions, args.seed)
+
+    count = render_versions(bank, versions, args.output, args.workers, args.title)
+    print(f"Wrote {count} versions of {len(versions[0].positions) if versions else 0} "
+          f"questions to {args.output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,310 @@
+# progress_store.py
+# Persistent progress store for the Anatomy MCQ Trainer.
+#
+# Users, quiz sessions and every answered question are kept in a local SQLite
+# database in WAL mode. The request path never touches the database: writes
+# are put on an in-process queue and a single background writer thread
+# drains it, committing whatever has accumulated (up to BATCH_SIZE rows or
+# FLUSH_INTERVAL seconds) in one transaction. Reads use their own
+# connections, which WAL lets run alongside the writer.
+#
+#     store = load_progress_store()
+#     quiz = QuizSession(bank, topic_index, recorder=SessionRecorder(store, "alice"))
+
+import atexit
+import functools
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB_PATH = os.path.join(HERE, "progress.sqlite3")
+DB_PATH_ENV = "ANATOMY_MCQ_DB"
+
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 0.05  # seconds
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    name        TEXT PRIMARY KEY,
+    created_at  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id           TEXT PRIMARY KEY,
+    user_name    TEXT REFERENCES users(name),
+    topic        TEXT,
+    seed         INTEGER NOT NULL,
+    shuffled     INTEGER NOT NULL,
+    started_at   REAL NOT NULL,
+    finished_at  REAL
+);
+CREATE TABLE IF NOT EXISTS responses (
+    session_id      TEXT NOT NULL REFERENCES sessions(id),
+    position        INTEGER NOT NULL,
+    question_id     INTEGER NOT NULL,
+    selected_index  INTEGER,
+    correct         INTEGER NOT NULL,
+    answered_at     REAL NOT NULL,
+    PRIMARY KEY (session_id, position)
+);
+CREATE INDEX IF NOT EXISTS sessions_by_user ON sessions(user_name, started_at);
+CREATE INDEX IF NOT EXISTS responses_by_question ON responses(question_id);
+"""
+
+# queued operation kind -> statement; consecutive operations of the same kind
+# are written with one executemany()
+_STATEMENTS = {
+    "user": "INSERT OR IGNORE INTO users (name, created_at) VALUES (?, ?)",
+    "session": (
+        "INSERT OR REPLACE INTO sessions "
+        "(id, user_name, topic, seed, shuffled, started_at, finished_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, NULL)"
+    ),
+    "response": (
+        "INSERT OR REPLACE INTO responses "
+        "(session_id, position, question_id, selected_index, correct, answered_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)"
+    ),
+    "finish": "UPDATE sessions SET finished_at = ? WHERE id = ?",
+}
+
+_STOP = object()
+
+
+class ProgressStore:
+    """
+    SQLite-backed store with a write-behind queue.
+
+    The record_* methods only enqueue and return immediately; flush() waits
+    until everything queued so far is committed.
+    """
+
+    def __init__(self, path, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.rows_written = 0
+        self.batches_written = 0
+
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+
+        self._queue = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="progress-store-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # ---------------------------------------
+    # Write side (non-blocking)
+    # ---------------------------------------
+
+    def record_user(self, name):
+        self._queue.put(("user", (name, time.time())))
+
+    def record_session(self, session_id, user_name, topic, seed, shuffled, started_at=None):
+        if user_name:
+            self.record_user(user_name)
+        started_at = time.time() if started_at is None else started_at
+        # seeds are unsigned 64-bit; store them in SQLite's signed INTEGER
+        signed_seed = seed - (1 << 64) if seed >= (1 << 63) else seed
+        self._queue.put(("session", (
+            session_id, user_name or None, topic, signed_seed, int(shuffled), started_at
+        )))
+
+    def record_response(self, session_id, position, resp):
+        self._queue.put(("response", (
+            session_id, position, resp.question_id, resp.selected_index,
+            int(resp.correct), resp.answered_at,
+        )))
+
+    def record_finish(self, session_id, finished_at=None):
+        finished_at = time.time() if finished_at is None else finished_at
+        self._queue.put(("finish", (finished_at, session_id)))
+
+    def flush(self, timeout=None):
+        """Block until everything queued before this call is committed."""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        """Flush and stop the writer thread."""
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+
+    # ---------------------------------------
+    # Writer thread
+    # ---------------------------------------
+
+    def _write_loop(self):
+        conn = self._connect()
+        try:
+            while True:
+                batch, events, stop = self._next_batch()
+                if batch:
+                    try:
+                        self._write(conn, batch)
+                    except sqlite3.Error:
+                        log.exception("progress store: dropped a batch of %d rows", len(batch))
+                for event in events:
+                    event.set()
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _next_batch(self):
+        """
+        Wait for one operation, then gather whatever else arrives within
+        flush_interval, up to batch_size operations.
+        """
+        batch, events = [], []
+        item = self._queue.get()
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            if item is _STOP:
+                return batch, events, True
+            if isinstance(item, threading.Event):
+                # a flush: commit now rather than waiting out the interval
+                events.append(item)
+                return batch, events, False
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                return batch, events, False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return batch, events, False
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                return batch, events, False
+
+    def _write(self, conn, batch):
+        with conn:
+            kind, rows = batch[0][0], []
+            for op_kind, row in batch:
+                if op_kind != kind:
+                    conn.executemany(_STATEMENTS[kind], rows)
+                    kind, rows = op_kind, []
+                rows.append(row)
+            conn.executemany(_STATEMENTS[kind], rows)
+        self.rows_written += len(batch)
+        self.batches_written += 1
+
+    # ---------------------------------------
+    # Read side
+    # ---------------------------------------
+
+    def read(self, sql, params=()):
+        """Run a read-only query on a fresh connection and return all rows."""
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def user_stats(self, user_name):
+        """(sessions, questions answered, answered correctly) for one user."""
+        (n_sessions,), = self.read(
+            "SELECT COUNT(*) FROM sessions WHERE user_name = ?", (user_name,)
+        )
+        (answered, correct), = self.read(
+            "SELECT COUNT(*), COALESCE(SUM(r.correct), 0) "
+            "FROM responses r JOIN sessions s ON s.id = r.session_id "
+            "WHERE s.user_name = ?",
+            (user_name,),
+        )
+        return n_sessions, answered, correct
+
+    def user_history(self, user_name):
+        """
+        Every answer one user has given, as (question_id, correct,
+        answered_at) rows in time order.
+        """
+        return self.read(
+            "SELECT r.question_id, r.correct, r.answered_at "
+            "FROM responses r JOIN sessions s ON s.id = r.session_id "
+            "WHERE s.user_name = ? ORDER BY r.answered_at",
+            (user_name,),
+        )
+
+    def recent_question_ids(self, user_name, since):
+        """Ids of the questions one user has answered at or after `since`."""
+        rows = self.read(
+            "SELECT DISTINCT r.question_id "
+            "FROM responses r JOIN sessions s ON s.id = r.session_id "
+            "WHERE s.user_name = ? AND r.answered_at >= ?",
+            (user_name, since),
+        )
+        return {question_id for question_id, in rows}
+
+    def item_responses(self):
+        """
+        Every stored answer as (question_id, person, correct) rows, where
+        person is the user name, or the session id for anonymous sessions.
+        Used to calibrate item parameters (irt.py).
+        """
+        return self.read(
+            "SELECT r.question_id, COALESCE(s.user_name, s.id), r.correct "
+            "FROM responses r JOIN sessions s ON s.id = r.session_id"
+        )
+
+
+class SessionRecorder:
+    """
+    QuizSession hook that persists one user's sessions and answers.
+
+    Attach it as QuizSession(..., recorder=SessionRecorder(store, user)).
+    user_name may be changed between quizzes; it is read at start().
+    """
+
+    def __init__(self, store, user_name=None):
+        self.store = store
+        self.user_name = user_name
+
+    def session_started(self, quiz):
+        topic, seed, shuffled = quiz.order.state()
+        self.store.record_session(quiz.session_id, self.user_name, topic, seed, shuffled)
+
+    def response_recorded(self, quiz, position, resp):
+        self.store.record_response(quiz.session_id, position, resp)
+
+    def session_finished(self, quiz):
+        self.store.record_finish(quiz.session_id)
+
+
+# like question_store._load_lock: without it, two sessions arriving at once
+# could each open a store, and two writer threads would share one database
+_load_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_store(path):
+    store = ProgressStore(path)
+    atexit.register(store.close)
+    return store
+
+
+def load_progress_store(path=None):
+    """
+    Process-wide ProgressStore at `path` (default: $ANATOMY_MCQ_DB, else
+    progress.sqlite3 next to app.py).
+    """
+    with _load_lock:
+        return _load_store(path or os.environ.get(DB_PATH_ENV) or DEFAULT_DB_PATH)
@@ -0,0 +1,177 @@
+# question_store.py
+# Process-wide question bank store for the Anatomy MCQ Trainer.
+#
+# Streamlit re-executes app.py from the top on every interaction, so anything
+# built at module level there is rebuilt for every click of every user. The
+# bank is loaded here instead: once per process, shared read-only by all
+# sessions.
+#
+# At runtime the bank is read from the compiled file produced by
+# build_bank.py (see bank_format.py), memory-mapped so that opening it costs
+# the same regardless of bank size.
+
+import functools
+import os
+import threading
+from array import array
+
+import numpy as np
+
+from bank_format import CompiledBank, is_current
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(HERE, "questions.py")
+# everything the compiled bank is derived from: a change to any of these
+# (e.g. a tag rule) makes questions.bank stale
+BUILD_INPUTS = [
+    SOURCE_PATH,
+    os.path.join(HERE, "question_tags.py"),
+    os.path.join(HERE, "build_bank.py"),
+    os.path.join(HERE, "bank_validator.py"),
+]
+COMPILED_BANK_PATH = os.path.join(HERE, "questions.bank")
+
+# Point the app at another compiled bank (e.g. a synthetic one for
+# benchmarks) without touching questions.bank.
+BANK_PATH_ENV = "ANATOMY_MCQ_BANK"
+
+
+def bank_path():
+    """
+    Path of the bank this process serves: $ANATOMY_MCQ_BANK if set, else
+    the bank compiled from questions.py.
+    """
+    return os.environ.get(BANK_PATH_ENV) or COMPILED_BANK_PATH
+
+
+def _is_stale(path):
+    if not is_current(path):  # missing, or written by an older format version
+        return True
+    try:
+        compiled_mtime = os.path.getmtime(path)
+    except FileNotFoundError:
+        return True
+    return compiled_mtime < max(os.path.getmtime(p) for p in BUILD_INPUTS)
+
+
+# lru_cache does not serialise first calls: without this, two sessions
+# arriving at once could both rebuild a stale bank
+_load_lock = threading.RLock()
+
+
+def load_question_bank(path=None):
+    """
+    Return the compiled question bank at `path` (default: bank_path()) as a
+    CompiledBank.
+
+    The default bank is (re)built from questions.py first if it is missing
+    or out of date. The result is cached, so every later call, from any
+    session, returns the same mapped bank.
+    """
+    with _load_lock:
+        return _load_bank(path or bank_path())
+
+
+@functools.lru_cache(maxsize=None)
+def _load_bank(path):
+    if path == COMPILED_BANK_PATH and _is_stale(path):
+        import build_bank
+        build_bank.build(path)
+    return CompiledBank(path)
+
+
+class TopicIndex:
+    """
+    Bank positions grouped by topic and by tag, built once per loaded bank.
+
+    topics is the sorted tuple of topic names; positions(topic) returns the
+    bank positions for one topic (or the whole bank for topic=None) without
+    touching any question text.
+
+    Every topic and tag also has a bitset over bank positions (a Python int
+    with bit i set for position i), so filter_bits() evaluates any
+    combination of topics and tags with a few bitwise operations, and
+    int.bit_count() counts the result.
+    """
+
+    def __init__(self, bank):
+        buckets = [array("I") for _ in bank.topics]
+        for pos, topic_id in enumerate(bank.topic_ids):
+            buckets[topic_id].append(pos)
+
+        self.topics = bank.topics
+        self.tags = bank.tags
+        self.total = len(bank)
+        self.all_bits = (1 << self.total) - 1
+        self._positions = dict(zip(bank.topics, buckets))
+        self._topic_bits = {t: _bitset(p, self.total) for t, p in self._positions.items()}
+
+        tag_counts = np.diff(np.asarray(bank.tag_offsets, dtype=np.int64))
+        owners = np.repeat(np.arange(self.total), tag_counts)
+        tag_ids = np.asarray(bank.tag_ids)
+        self._tag_bits = {
+            tag: _bitset(owners[tag_ids == i], self.total) for i, tag in enumerate(bank.tags)
+        }
+
+    def positions(self, topic=None):
+        if topic is None:
+            return range(self.total)
+        return self._positions.get(topic, array("I"))
+
+    def count(self, topic=None):
+        return len(self.positions(topic))
+
+    def topic_bits(self, topic):
+        return self._topic_bits.get(topic, 0)
+
+    def tag_bits(self, tag):
+        return self._tag_bits.get(tag, 0)
+
+    def filter_bits(self, topics=(), any_tags=(), all_tags=(), exclude_tags=()):
+        """
+        Bitset of the questions in any of `topics` (all topics if empty)
+        that have at least one of `any_tags` (if given), every one of
+        `all_tags` and none of `exclude_tags`.
+        """
+        bits = self.all_bits
+        if topics:
+            bits = 0
+            for topic in topics:
+                bits |= self.topic_bits(topic)
+        if any_tags:
+            either = 0
+            for tag in any_tags:
+                either |= self.tag_bits(tag)
+            bits &= either
+        for tag in all_tags:
+            bits &= self.tag_bits(tag)
+        for tag in exclude_tags:
+            bits &= ~self.tag_bits(tag)
+        return bits
+
+    def bits_positions(self, bits):
+        """Bank positions set in `bits`, ascending, as an array('I')."""
+        raw = np.frombuffer(bits.to_bytes((self.total + 7) // 8, "little"), dtype=np.uint8)
+        found = np.flatnonzero(np.unpackbits(raw, count=self.total, bitorder="little"))
+        positions = array("I")
+        positions.frombytes(found.astype(np.uint32).tobytes())
+        return positions
+
+
+def _bitset(positions, size):
+    mask = np.zeros(size, dtype=bool)
+    mask[np.asarray(positions, dtype=np.intp)] = True
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+
+def load_topic_index(path=None):
+    """
+    Return the shared TopicIndex for the bank at `path` (default: bank_path()).
+    """
+    with _load_lock:
+        return _load_topic_index(path or bank_path())
+
+
+@functools.lru_cache(maxsize=None)
+def _load_topic_index(path):
+    return TopicIndex(_load_bank(path))
@@ -0,0 +1,50 @@
+# question_tags.py
+# Default tags for questions that do not list their own.
+#
+# Questions may carry a "tags" list in questions.py; on top of that,
+# build_bank.py tags every question by keyword so that tag filters are
+# useful without hand-tagging the whole bank. A tag applies when any of its
+# patterns matches the stem or the explanation.
+
+import re
+
+DEFAULT_TAG_RULES = {
+    "clinical": (
+        r"\bpatients?\b", r"\bclinical(ly)?\b", r"\binjur", r"\blesions?\b",
+        r"\bdamage", r"\bsyndrome", r"\bdisease", r"\bdeficien", r"\bsymptom",
+        r"\bfractur", r"\bpalsy\b", r"\bparalys", r"\bhernia", r"\bblock(ed|ade|ing)\b",
+    ),
+    "histology": (
+        r"\bepitheli", r"\bhistolog", r"\bmicroscop", r"\blined by\b", r"\bcilia",
+        r"\bgoblet\b", r"\bstain", r"\bcell types?\b", r"\blamina\b", r"\bfibres?\b",
+        r"\bfibers?\b", r"\bmatrix\b",
+    ),
+    "embryology": (
+        r"\bembryo", r"\bfo?etal\b", r"\bfo?etus\b", r"\bgastrulation\b",
+        r"\bprimitive streak\b", r"\bneural (tube|crest|plate)\b", r"\bnotochord\b",
+        r"\bgerm layers?\b", r"\b(ecto|meso|endo)derm", r"\bzygote\b",
+        r"\bblastocyst\b", r"\bimplantation\b", r"\bdevelopment(al)?\b",
+    ),
+    "physiology": (
+        r"\bhormones?\b", r"\bsecret", r"\bregulat", r"\btransport",
+        r"\bpotential\b", r"\bpressure\b", r"\breceptors?\b", r"\bstimulat",
+        r"\bdiffusion\b", r"\bosmo",
+    ),
+}
+
+_TAG_PATTERNS = {
+    tag: re.compile("|".join(patterns), re.IGNORECASE)
+    for tag, patterns in DEFAULT_TAG_RULES.items()
+}
+
+
+def default_tags(question):
+    """Tag names whose keywords appear in `question`'s stem or explanation."""
+    text = f"{question['question']}\n{question['explanation']}"
+    return [tag for tag, pattern in _TAG_PATTERNS.items() if pattern.search(text)]
+
+
+def with_default_tags(question):
+    """Copy of `question` whose tags also include its default tags."""
+    tags = set(question.get("tags", ())) | set(default_tags(question))
+    return {**question, "tags": sorted(tags)}
@@ -0,0 +1,283 @@
+# quiz_engine.py
+# Headless quiz engine for the Anatomy MCQ Trainer.
+#
+# QuizSession holds everything one student's quiz needs (order, position,
+# responses) on top of the shared, read-only bank and topic index. It has no
+# Streamlit dependency: app.py is a view over it, and benchmarks or other
+# front ends can drive it directly.
+#
+#     quiz = QuizSession(load_question_bank(), load_topic_index())
+#     quiz.start(topic="Urinary System")
+#     while not quiz.finished:
+#         q = quiz.current_question()
+#         quiz.answer(display_index=0)
+#         quiz.next()
+#     result = quiz.summary()
+
+import random
+import uuid
+from array import array
+from collections import namedtuple
+
+from question_store import load_question_bank, load_topic_index
+from quiz_order import QuizOrder
+from responses import Response
+from summary import cached_pdf_summary, cached_text_summary
+
+# total / correct are counts, score is a percentage (0.0 when nothing was
+# answered), wrong is the list of incorrect Response records in quiz order
+SessionSummary = namedtuple("SessionSummary", "total correct score wrong")
+
+
+class QuizSession:
+    """
+    One student's pass through a filtered, optionally shuffled question set.
+
+    Responses are kept per quiz position: answering the current question
+    again replaces its response, and finishing early simply stops with the
+    responses given so far. next() and next_page() refuse to move past an
+    unanswered question, so responses[i] is always the answer at position i.
+
+    An optional recorder (e.g. progress_store.SessionRecorder) is told about
+    session_started(quiz), response_recorded(quiz, position, resp) and
+    session_finished(quiz); it must not block.
+
+    The order is normally a QuizOrder, fixed at start(). start_with() also
+    takes a dynamic order (dynamic = True, e.g. scheduler.ScheduledOrder)
+    that picks each question only when it is first read and is told about
+    every answer through order.record(position, resp). page() reads a
+    whole page before any of it is answered, so a dynamic order should be
+    run one question at a time (app.py does).
+    """
+
+    def __init__(self, bank, topic_index, recorder=None):
+        self.bank = bank
+        self.topic_index = topic_index
+        self.recorder = recorder
+        self.session_id = None
+        self.order = ()
+        self.current_index = 0
+        self.responses = []
+
+    # The bank and topic index are process-wide and memory-mapped, so a
+    # pickled session carries only its compact state and rebinds to the
+    # shared bank when it is loaded again. The recorder is not carried over.
+    # A dynamic order depends on live scheduler state, so it comes back as a
+    # fixed order over the questions it has picked so far: the answers and
+    # position are kept, and the session finishes after the last of them.
+    def __getstate__(self):
+        if not self.started:
+            order, selection = None, None
+        elif getattr(self.order, "dynamic", False):
+            order = (self.order.topic, self.order.seed, False)
+            selection = array("I", self.order.picked)
+        else:
+            order, selection = self.order.state(), self.order.selection
+        return {
+            "bank_path": self.bank.path,
+            "session_id": self.session_id,
+            "order": order,
+            "selection": selection,
+            "current_index": self.current_index,
+            "responses": self.responses,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(load_question_bank(state["bank_path"]),
+                      load_topic_index(state["bank_path"]))
+        if state["order"] is not None:
+            self.resume(*state["order"], state["current_index"], state["responses"],
+                        positions=state["selection"])
+        self.session_id = state["session_id"]
+
+    # ---------------------------------------
+    # Lifecycle
+    # ---------------------------------------
+
+    @property
+    def started(self):
+        return len(self.order) > 0
+
+    @property
+    def finished(self):
+        return self.started and self.current_index >= len(self.order)
+
+    def __len__(self):
+        return len(self.order)
+
+    def start(self, topic=None, shuffled=True, seed=None, positions=None):
+        """
+        Begin a new quiz over `topic` (None = all topics), or over explicit
+        bank `positions` such as search results, discarding any previous
+        progress. Returns the number of questions.
+        """
+        if seed is None:
+            seed = random.getrandbits(64)
+        return self.start_with(
+            QuizOrder(self.topic_index, topic, seed, shuffled=shuffled, positions=positions)
+        )
+
+    def start_with(self, order):
+        """
+        Begin a new quiz over a ready-made order (anything with len(),
+        order[i] -> bank position, state() and option_order()). Returns the
+        number of questions.
+        """
+        self.session_id = uuid.uuid4().hex
+        self.order = order
+        self.current_index = 0
+        self.responses = []
+        if self.recorder is not None:
+            self.recorder.session_started(self)
+        return len(self.order)
+
+    def resume(self, topic, seed, shuffled, current_index, responses=(), positions=None):
+        """
+        Rebuild a quiz from QuizOrder.state() plus its position (and its
+        selection, if it had one), e.g. on another server node. `responses`
+        must hold the answers to every position before `current_index`.
+        """
+        if len(responses) < current_index:
+            raise ValueError(
+                f"{len(responses)} responses given for a quiz at position {current_index}"
+            )
+        self.order = QuizOrder(self.topic_index, topic, seed, shuffled=shuffled,
+                               positions=positions)
+        self.current_index = current_index
+        self.responses = list(responses)
+        if self.session_id is None:
+            self.session_id = uuid.uuid4().hex
+
+    def state(self):
+        """(topic, seed, shuffled, current_index) for resume()."""
+        return (*self.order.state(), self.current_index)
+
+    def next(self):
+        """Move on to the next question; the current one must be answered."""
+        if self.finished:
+            return
+        if self.current_response is None:
+            raise RuntimeError("answer the current question before moving on")
+        self._advance_to(self.current_index + 1)
+
+    def finish(self):
+        """Stop now; the quiz counts as finished with the answers given."""
+        self._advance_to(len(self.order))
+
+    def _advance_to(self, index):
+        was_finished = self.finished
+        self.current_index = min(index, len(self.order))
+        if self.finished and not was_finished and self.recorder is not None:
+            self.recorder.session_finished(self)
+
+    # ---------------------------------------
+    # Current question
+    # ---------------------------------------
+
+    def current_question(self):
+        """The current question dict, or None once the quiz is finished."""
+        if not self.started or self.finished:
+            return None
+        return self.bank[self.order[self.current_index]]
+
+    def option_order(self, question):
+        """Original option indices of `question` in display order."""
+        return self.order.option_order(question["id"], len(question["options"]))
+
+    @property
+    def current_response(self):
+        """The Response for the current question, or None if not yet answered."""
+        if self.current_index < len(self.responses):
+            return self.responses[self.current_index]
+        return None
+
+    def answer(self, display_index):
+        """
+        Grade the option shown at `display_index` for the current question
+        and record it. Returns the Response.
+        """
+        q = self.current_question()
+        if q is None:
+            raise RuntimeError("no current question to answer")
+        return self._record(self.current_index, q, display_index)
+
+    def _record(self, position, q, display_index, answered_at=None):
+        # Map selected display index back to original option index
+        if display_index is None:
+            original_index = None
+        else:
+            original_index = self.option_order(q)[display_index]
+        correct = original_index == q["answer_index"]
+
+        resp = Response(q["id"], original_index, correct, answered_at)  # store ORIGINAL index
+        if len(self.responses) > position:
+            self.responses[position] = resp
+        else:
+            self.responses.append(resp)
+        if getattr(self.order, "dynamic", False):
+            self.order.record(position, resp)
+        if self.recorder is not None:
+            self.recorder.response_recorded(self, position, resp)
+        return resp
+
+    def correct_display_index(self, question):
+        """Where the correct answer of `question` appears in display order."""
+        return self.option_order(question).index(question["answer_index"])
+
+    # ---------------------------------------
+    # Page mode: several questions graded at once
+    # ---------------------------------------
+
+    def page(self, size):
+        """(quiz position, question) pairs of the page starting at the current question."""
+        if not self.started or self.finished:
+            return []
+        end = min(self.current_index + size, len(self.order))
+        return [(pos, self.bank[self.order[pos]]) for pos in range(self.current_index, end)]
+
+    def answer_page(self, size, display_indices, answered_at=None):
+        """
+        Grade a whole page in one go. `display_indices` holds the chosen
+        display index for each question of page(size), or None where the
+        question was left blank (recorded as not answered, incorrect).
+        `answered_at` optionally gives a Unix timestamp per question.
+        """
+        page = self.page(size)
+        answered_at = list(answered_at or [])
+        answered_at += [None] * (len(page) - len(answered_at))
+        return [
+            self._record(pos, q, display_index, ts)
+            for (pos, q), display_index, ts in zip(page, display_indices, answered_at)
+        ]
+
+    def page_answered(self, size):
+        end = min(self.current_index + size, len(self.order))
+        return self.started and len(self.responses) >= end
+
+    def next_page(self, size):
+        """Move on to the next page; every question of this one must be answered."""
+        if self.finished:
+            return
+        if not self.page_answered(size):
+            raise RuntimeError("answer the whole page before moving on")
+        self._advance_to(self.current_index + size)
+
+    # ---------------------------------------
+    # Results
+    # ---------------------------------------
+
+    def question_for(self, resp):
+        return resp.question(self.bank)
+
+    def summary(self):
+        total = len(self.responses)
+        wrong = [r for r in self.responses if not r.correct]
+        correct = total - len(wrong)
+        score = (correct / total) * 100 if total else 0.0
+        return SessionSummary(total, correct, score, wrong)
+
+    def text_summary(self):
+        return cached_text_summary(tuple(self.responses), self.bank)
+
+    def pdf_summary(self):
+        return cached_pdf_summary(tuple(self.responses), self.bank)
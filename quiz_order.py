@@ -0,0 +1,168 @@
+# quiz_order.py
+# Seeded, stateless question and option orderings.
+#
+# A quiz is fully described by (topic, seed, shuffled). The question order is
+# a keyed pseudo-random permutation of the topic's bank positions, and each
+# question's option order is derived from (seed, question id), so nothing
+# grows with the length of the quiz and a session can be rebuilt anywhere
+# from those three values plus the current position. A quiz over an explicit
+# selection (e.g. search results) also keeps that list of positions.
+
+from collections.abc import Sequence
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix(x):
+    """splitmix64 finalizer: a fast, well-distributed 64-bit integer hash."""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+class KeyedPermutation(Sequence):
+    """
+    Pseudo-random permutation of range(n), computed one index at a time.
+
+    A balanced Feistel network over the smallest even-bit domain >= n is a
+    bijection; values that land outside range(n) are fed back through it
+    (cycle walking) until they fall inside. perm[i] costs a few integer
+    hashes and no per-permutation storage.
+    """
+
+    ROUNDS = 4
+
+    def __init__(self, n, seed):
+        self.n = n
+        self.seed = seed & _MASK64
+        half_bits = 1
+        while (1 << (2 * half_bits)) < n:
+            half_bits += 1
+        self._half_bits = half_bits
+        self._half_mask = (1 << half_bits) - 1
+
+    def __len__(self):
+        return self.n
+
+    def _feistel(self, x):
+        left = x >> self._half_bits
+        right = x & self._half_mask
+        for r in range(self.ROUNDS):
+            f = _mix(self.seed ^ (r << 56) ^ right) & self._half_mask
+            left, right = right, left ^ f
+        return (left << self._half_bits) | right
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("permutation index out of range")
+        x = self._feistel(i)
+        while x >= self.n:
+            x = self._feistel(x)
+        return x
+
+
+class QuizOrder(Sequence):
+    """
+    Question order of one quiz: order[i] is the bank position of question i.
+
+    Built from the shared TopicIndex, so the only per-session data is the
+    topic, the seed and the shuffle flag (see state()). If `positions` is
+    given it replaces the topic's positions, `topic` then being only a
+    label, and is kept as `selection`.
+    """
+
+    def __init__(self, topic_index, topic, seed, shuffled=True, positions=None):
+        self.topic = topic
+        self.seed = seed
+        self.shuffled = shuffled
+        self.selection = positions
+        self._positions = topic_index.positions(topic) if positions is None else positions
+        self._perm = KeyedPermutation(len(self._positions), seed) if shuffled else None
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __getitem__(self, i):
+        if self._perm is None:
+            return self._positions[i]
+        return self._positions[self._perm[i]]
+
+    def state(self):
+        """(topic, seed, shuffled): everything needed to rebuild this order."""
+        return self.topic, self.seed, self.shuffled
+
+    def option_order(self, question_id, n_options):
+        return option_order(self.seed, question_id, n_options)
+
+
+class DynamicOrder(Sequence):
+    """
+    Base of the dynamic question orders (see QuizSession.start_with()).
+
+    order[i] picks question i the first time it is read, after the answer
+    to i - 1 has been passed to record(), and `picked` keeps every bank
+    position chosen so far. Only the first answer at each position is
+    passed on. Subclasses implement _pick() (the next bank position, or
+    None when nothing is left) and _update(bank_position, resp).
+    """
+
+    shuffled = True
+    dynamic = True
+
+    def __init__(self, topic, seed, length):
+        self.topic = topic
+        self.seed = seed
+        self.length = length
+        self.picked = []
+        self._recorded = set()
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.length:
+            raise IndexError("quiz position out of range")
+        while len(self.picked) <= i:
+            pos = self._pick()
+            if pos is None:
+                self.length = len(self.picked)
+                raise IndexError("no questions left to pick")
+            self.picked.append(pos)
+        return self.picked[i]
+
+    def state(self):
+        return self.topic, self.seed, self.shuffled
+
+    def option_order(self, question_id, n_options):
+        return option_order(self.seed, question_id, n_options)
+
+    def record(self, position, resp):
+        if position in self._recorded:
+            return
+        self._recorded.add(position)
+        self._update(self.picked[position], resp)
+
+    def _pick(self):
+        raise NotImplementedError
+
+    def _update(self, pos, resp):
+        raise NotImplementedError
+
+
+def option_order(seed, question_id, n_options):
+    """
+    Original option indices of `question_id` in display order.
+
+    A Fisher-Yates shuffle driven by a hash chain keyed on (seed, question
+    id), so the same question always shows the same order within a quiz.
+    """
+    order = list(range(n_options))
+    x = _mix(seed ^ _mix(question_id))
+    for j in range(n_options - 1, 0, -1):
+        x = _mix(x)
+        k = x % (j + 1)
+        order[j], order[k] = order[k], order[j]
+    return order
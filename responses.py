@@ -0,0 +1,37 @@
+# responses.py
+# Compact per-session answer records.
+#
+# A session keeps one Response per answered question. Only the question id
+# is stored; the question itself is looked up in the shared bank when a
+# summary or review needs its text.
+
+import time
+
+
+class Response:
+    """
+    One answered question.
+
+    question_id: id of the question in the bank
+    selected_index: ORIGINAL option index chosen (0..n-1), or None
+    correct: bool
+    answered_at: Unix timestamp of the submission
+    """
+
+    __slots__ = ("question_id", "selected_index", "correct", "answered_at")
+
+    def __init__(self, question_id, selected_index, correct, answered_at=None):
+        self.question_id = question_id
+        self.selected_index = selected_index
+        self.correct = correct
+        self.answered_at = time.time() if answered_at is None else answered_at
+
+    def __repr__(self):
+        return (
+            f"Response(question_id={self.question_id!r}, "
+            f"selected_index={self.selected_index!r}, correct={self.correct!r})"
+        )
+
+    def question(self, bank):
+        """Resolve the full question dict from `bank`."""
+        return bank.by_id(self.question_id)
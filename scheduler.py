@@ -0,0 +1,188 @@
+# scheduler.py
+# Spaced-repetition study mode (SM-2) for the Anatomy MCQ Trainer.
+#
+# Each question a user has seen is a card with an SM-2 interval, ease factor
+# and due time. Seen cards sit in a min-heap keyed on due time, so choosing
+# the next card is a heap pop (O(log n)) however large the bank or the review
+# history. Cards the user has never seen are drawn from a seeded permutation
+# of the topic's bank positions, only once nothing is due.
+#
+# A scheduler is rebuilt at the start of a study session by replaying the
+# user's stored responses (progress_store.ProgressStore.user_history()).
+
+import heapq
+import time
+
+from quiz_order import DynamicOrder, KeyedPermutation
+
+DAY = 24 * 60 * 60
+# a failed card comes back within the same sitting before its 1-day interval
+RELEARN_DELAY = 10 * 60
+
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+
+# SM-2 grades answers 0-5; a multiple-choice answer is either right or wrong
+QUALITY_CORRECT = 4
+QUALITY_WRONG = 1
+
+
+class CardState:
+    """SM-2 state of one question for one user."""
+
+    __slots__ = ("question_id", "repetitions", "interval_days", "ease", "lapses", "due")
+
+    def __init__(self, question_id):
+        self.question_id = question_id
+        self.repetitions = 0
+        self.interval_days = 0
+        self.ease = INITIAL_EASE
+        self.lapses = 0
+        self.due = 0.0
+
+    def __repr__(self):
+        return (
+            f"CardState(question_id={self.question_id!r}, interval_days={self.interval_days!r}, "
+            f"ease={self.ease:.2f}, due={self.due:.0f})"
+        )
+
+
+def sm2_review(card, correct, at):
+    """
+    Apply one review to `card` (in place) using the SM-2 rules.
+    """
+    quality = QUALITY_CORRECT if correct else QUALITY_WRONG
+    if quality >= 3:
+        if card.repetitions == 0:
+            card.interval_days = 1
+        elif card.repetitions == 1:
+            card.interval_days = 6
+        else:
+            card.interval_days = round(card.interval_days * card.ease)
+        card.repetitions += 1
+        card.due = at + card.interval_days * DAY
+    else:
+        card.repetitions = 0
+        card.interval_days = 1
+        card.lapses += 1
+        card.due = at + RELEARN_DELAY
+    card.ease = max(
+        MIN_EASE, card.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
+    )
+
+
+class ReviewScheduler:
+    """
+    Due queue over one topic's cards (topic=None: the whole bank), or over
+    explicit bank `positions`.
+
+    next_card() returns the bank position to study next: the most overdue
+    card if any is due, else a new card, else the card due soonest (review
+    ahead). A card handed out is out of the queue until review() puts it
+    back with its new due time.
+    """
+
+    def __init__(self, bank, topic_index, topic=None, seed=0, clock=time.time, positions=None):
+        self.bank = bank
+        self.topic = topic
+        self.seed = seed
+        self.clock = clock
+        self.cards = {}
+        self._heap = []  # (due, question_id)
+        self._pending = set()
+
+        self._positions = topic_index.positions(topic) if positions is None else positions
+        self._new_order = KeyedPermutation(len(self._positions), seed)
+        self._next_new = 0
+
+    def __len__(self):
+        return len(self._positions)
+
+    @classmethod
+    def from_history(cls, bank, topic_index, history, topic=None, seed=0, clock=time.time,
+                     positions=None):
+        """
+        Build a scheduler by replaying (question_id, correct, answered_at)
+        rows in time order. Questions outside `topic` (or `positions`, if
+        given) or no longer in the bank are skipped.
+        """
+        scheduler = cls(bank, topic_index, topic=topic, seed=seed, clock=clock,
+                        positions=positions)
+        allowed = None if positions is None else set(positions)
+        for question_id, correct, answered_at in history:
+            try:
+                pos = bank.position_of(question_id)
+            except KeyError:
+                continue
+            if allowed is not None:
+                if pos not in allowed:
+                    continue
+            elif topic is not None and bank.topic_of(pos) != topic:
+                continue
+            card = scheduler.cards.get(question_id)
+            if card is None:
+                card = scheduler.cards[question_id] = CardState(question_id)
+            sm2_review(card, correct, answered_at)
+
+        scheduler._heap = [(card.due, qid) for qid, card in scheduler.cards.items()]
+        heapq.heapify(scheduler._heap)
+        return scheduler
+
+    def _pop_card(self):
+        while self._heap:
+            due, qid = heapq.heappop(self._heap)
+            if self.cards[qid].due == due:  # skip entries superseded by a later review
+                return qid
+        return None
+
+    def _new_card(self):
+        while self._next_new < len(self._new_order):
+            pos = self._positions[self._new_order[self._next_new]]
+            self._next_new += 1
+            qid = self.bank.ids[pos]
+            if qid not in self.cards and qid not in self._pending:
+                return qid
+        return None
+
+    def next_card(self, now=None):
+        """Bank position of the next card to study, or None if none is left."""
+        now = self.clock() if now is None else now
+        if self._heap and self._heap[0][0] <= now:
+            qid = self._pop_card()
+        else:
+            qid = self._new_card()
+            if qid is None:
+                qid = self._pop_card()
+        if qid is None:
+            return None
+        self._pending.add(qid)
+        return self.bank.position_of(qid)
+
+    def review(self, question_id, correct, at=None):
+        at = self.clock() if at is None else at
+        card = self.cards.get(question_id)
+        if card is None:
+            card = self.cards[question_id] = CardState(question_id)
+        sm2_review(card, correct, at)
+        self._pending.discard(question_id)
+        heapq.heappush(self._heap, (card.due, question_id))
+
+
+class ScheduledOrder(DynamicOrder):
+    """
+    Question order of a spaced-repetition session of up to `length` cards.
+
+    A dynamic order (see quiz_order.DynamicOrder): order[i] asks the
+    scheduler for the next card, and each first answer is graded into the
+    card's schedule, so it cannot be rebuilt from state() alone.
+    """
+
+    def __init__(self, scheduler, length):
+        super().__init__(scheduler.topic, scheduler.seed, min(length, len(scheduler)))
+        self.scheduler = scheduler
+
+    def _pick(self):
+        return self.scheduler.next_card()
+
+    def _update(self, pos, resp):
+        self.scheduler.review(resp.question_id, resp.correct, resp.answered_at)
@@ -0,0 +1,154 @@
+# search_index.py
+# Keyword search over the question bank.
+#
+# An inverted index maps every term of a question's stem, options and
+# explanation to the bank positions containing it, with a BM25 weight per
+# posting, so a query touches only the postings of its own terms. It is
+# built once per loaded bank and shared by every session, like the
+# TopicIndex.
+#
+#     index = load_search_index()
+#     index.search("brachial plexus")   # -> [(bank position, score), ...]
+
+import functools
+import math
+import re
+import threading
+from array import array
+from collections import Counter
+
+import numpy as np
+
+from question_store import bank_path, load_question_bank
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+STOPWORDS = frozenset("""
+    a an and are as at be by for from has have in is it its of on or that the
+    this to was were which with what who whom why how does do not no than then
+    """.split())
+
+# BM25 ranking parameters
+K1 = 1.2
+B = 0.75
+
+# the question stem counts this many times when ranking, options and
+# explanation once
+STEM_WEIGHT = 2
+
+
+def _stem(term):
+    """Fold simple plurals ("vessels" -> "vessel") without touching -us/-is/-ss."""
+    if len(term) > 3 and term.endswith("s") and not term.endswith(("ss", "us", "is")):
+        return term[:-1]
+    return term
+
+
+def tokenize(text):
+    """Lower-cased, plural-folded search terms of `text`, stopwords removed."""
+    return [_stem(t) for t in _TOKEN.findall(text.casefold()) if t not in STOPWORDS]
+
+
+class SearchIndex:
+    """
+    Inverted index over question, options and explanation text.
+
+    Each posting carries its BM25 weight, computed once at build time, so a
+    query is a sum of precomputed weights over the postings of its terms.
+    """
+
+    def __init__(self, bank):
+        self.bank = bank
+        postings = {}  # term -> (positions, term counts)
+        lengths = array("I")
+
+        for pos in range(len(bank)):
+            q = bank[pos]
+            counts = Counter(tokenize(q["question"]))
+            for term in counts:
+                counts[term] *= STEM_WEIGHT
+            for text in (*q["options"], q["explanation"]):
+                counts.update(tokenize(text))
+            lengths.append(sum(counts.values()))
+            for term, tf in counts.items():
+                entry = postings.get(term)
+                if entry is None:
+                    entry = postings[term] = (array("I"), array("I"))
+                entry[0].append(pos)
+                entry[1].append(tf)
+
+        self.size = len(lengths)
+        lengths = np.frombuffer(lengths, dtype=np.uint32).astype(np.float64)
+        norms = K1 * (1 - B + B * lengths / lengths.mean()) if self.size else lengths
+
+        # term -> (bank positions, BM25 weights)
+        self._postings = {}
+        for term, (positions, tfs) in postings.items():
+            positions = np.frombuffer(positions, dtype=np.uint32).astype(np.intp)
+            tf = np.frombuffer(tfs, dtype=np.uint32).astype(np.float64)
+            df = len(positions)
+            idf = math.log(1 + (self.size - df + 0.5) / (df + 0.5))
+            weights = idf * tf * (K1 + 1) / (tf + norms[positions])
+            self._postings[term] = (positions, weights.astype(np.float32))
+
+    def __len__(self):
+        return self.size
+
+    def search(self, query, limit=None, within=None):
+        """
+        (bank position, score) pairs for `query`, best first. Questions
+        containing every query term are returned if there are any, else
+        those containing at least one. `within` optionally restricts the
+        results to a collection of bank positions.
+        """
+        found, scores = self._rank(query, limit, within)
+        return [(int(pos), float(scores[pos])) for pos in found]
+
+    def positions(self, query, within=None):
+        """Matching bank positions, best first."""
+        found, _scores = self._rank(query, None, within)
+        return found.tolist()
+
+    def _rank(self, query, limit, within):
+        terms = list(dict.fromkeys(tokenize(query)))
+        entries = [self._postings[t] for t in terms if t in self._postings]
+        if not entries:
+            return np.empty(0, dtype=np.intp), None
+
+        scores = np.zeros(self.size, dtype=np.float32)
+        matched = np.zeros(self.size, dtype=np.int32)
+        for positions, weights in entries:
+            scores[positions] += weights
+            matched[positions] += 1
+        if within is None:
+            allowed = np.ones(self.size, dtype=bool)
+        else:
+            allowed = np.zeros(self.size, dtype=bool)
+            allowed[np.asarray(within, dtype=np.intp)] = True
+        hits = (matched == len(terms)) & allowed
+        if not hits.any():
+            hits = (matched > 0) & allowed
+
+        found = np.flatnonzero(hits)
+        if limit is not None and limit < len(found):
+            found = found[np.argpartition(-scores[found], limit - 1)[:limit]]
+        # best first; ties in bank order
+        return found[np.lexsort((found, -scores[found]))], scores
+
+
+# like question_store._load_lock: lru_cache would let two sessions arriving
+# at once each build the index
+_load_lock = threading.Lock()
+
+
+def load_search_index(path=None):
+    """
+    Return the shared SearchIndex for the bank at `path` (default: bank_path()).
+    """
+    with _load_lock:
+        return _load_search_index(path or bank_path())
+
+
+@functools.lru_cache(maxsize=None)
+def _load_search_index(path):
+    return SearchIndex(load_question_bank(path))
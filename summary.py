@@ -0,0 +1,340 @@
+# summary.py
+# Session summary export (plain text and PDF) for the Anatomy MCQ Trainer.
+#
+# The text summary is produced as a stream of chunks (one header chunk, then
+# one per response) so a large session never needs its full list of lines in
+# memory, and the app only builds the file when the user asks to download it.
+# The PDF is rendered with fpdf2 from the same per-response blocks, one
+# response at a time with pages broken as they fill, so no intermediate copy
+# of the session is built.
+# Finished summaries are memoized in a process-wide LRU keyed by a
+# fingerprint of the responses and the minute printed in the header, so
+# asking again for an unchanged session is a dictionary lookup. The cache is
+# bounded by the total size of the summaries it holds, since one PDF of a
+# long session runs to megabytes.
+
+import hashlib
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from datetime import datetime
+from io import BytesIO, StringIO
+
+from fpdf import FPDF
+
+SUMMARY_CACHE_BYTES = 32 * 2**20
+
+
+def _header_lines(responses, generated_at):
+    num_correct = sum(1 for r in responses if r.correct)
+    lines = [
+        "Anatomy MCQ Session Summary",
+        f"Date: {generated_at.strftime('%Y-%m-%d %H:%M')}",
+        f"Total questions attempted: {len(responses)}",
+        f"Total correct: {num_correct}",
+    ]
+    if responses:
+        lines.append(f"Score: {num_correct / len(responses) * 100:.1f}%")
+    return lines
+
+
+def _response_block(resp, bank):
+    """
+    The pieces of one response shared by the text and PDF summaries.
+    """
+    q = resp.question(bank)
+    selected_orig = resp.selected_index
+    if selected_orig is not None:
+        your_ans_str = chr(65 + selected_orig)
+    else:
+        your_ans_str = "Not answered"
+
+    return {
+        "heading": f"[{q['topic']}] {q['question']}",
+        "options": [f"{chr(65 + idx)}) {opt}" for idx, opt in enumerate(q["options"])],
+        "your_answer": your_ans_str,
+        "correct_answer": chr(65 + q["answer_index"]),
+        "correct": resp.correct,
+        "explanation": q["explanation"],
+    }
+
+
+def iter_text_summary(responses, bank, generated_at=None):
+    """
+    Yield the plain-text summary of a session chunk by chunk.
+
+    responses: sequence of Response records; question text is looked up in
+    `bank` by question_id as each chunk is produced.
+    """
+    if generated_at is None:
+        generated_at = datetime.now()
+
+    lines = _header_lines(responses, generated_at)
+    lines.append("-" * 60)
+    yield "\n".join(lines)
+
+    for i, resp in enumerate(responses, start=1):
+        block = _response_block(resp, bank)
+        lines = [f"\nQ{i}. {block['heading']}"]
+        lines.extend(f"  {opt}" for opt in block["options"])
+        lines.append(f"Your answer: {block['your_answer']}")
+        lines.append(f"Correct answer: {block['correct_answer']}")
+        lines.append(f"Result: {'Correct' if block['correct'] else 'Incorrect'}")
+        lines.append(f"Explanation: {block['explanation']}")
+        lines.append("-" * 60)
+        yield "\n" + "\n".join(lines)
+
+
+def write_text_summary(responses, bank, fp, generated_at=None):
+    """
+    Stream the text summary into the file-like object `fp`.
+    """
+    for chunk in iter_text_summary(responses, bank, generated_at):
+        fp.write(chunk)
+
+
+def generate_text_summary(responses, bank, generated_at=None):
+    """
+    Return the whole text summary as one string.
+    """
+    buf = StringIO()
+    write_text_summary(responses, bank, buf, generated_at)
+    return buf.getvalue()
+
+
+# -------------------------------------------------
+# PDF summary
+# -------------------------------------------------
+
+_PDF_REPLACEMENTS = {
+    "\u2013": "-", "\u2014": "-", "\u2192": "->", "\u2190": "<-",
+    "\u2018": "'", "\u2019": "'", "\u201c": '"', "\u201d": '"',
+    "\u03b1": "alpha", "\u03b2": "beta", "\u03b3": "gamma",
+    "\u2212": "-",  # minus sign, also what NFKC makes of a superscript minus
+}
+
+
+def _pdf_char(ch):
+    if ch in _PDF_REPLACEMENTS:
+        return _PDF_REPLACEMENTS[ch]
+    if ord(ch) < 256:
+        return ch
+    # e.g. superscript/subscript digits and signs: "Na⁺" -> "Na+", "CO₂" -> "CO2"
+    folded = unicodedata.normalize("NFKC", ch)
+    folded = "".join(_PDF_REPLACEMENTS.get(c, c) for c in folded)
+    return folded.encode("latin-1", "replace").decode("latin-1")
+
+
+def pdf_text(text):
+    """
+    The built-in PDF fonts only cover Latin-1; transliterate everything else.
+    """
+    if text.isascii():
+        return text
+    return "".join(_pdf_char(ch) for ch in text)
+
+
+def wrap_text(pdf, text, width):
+    """
+    Greedy word wrap measured with the current font. Much cheaper than
+    multi_cell()'s character-by-character line breaker on long sessions.
+    """
+    # core fonts expose their glyph widths (in 1/1000 em); summing them
+    # directly avoids get_string_width()'s per-call text shaping overhead
+    char_widths = getattr(pdf.current_font, "cw", None)
+    if char_widths is not None:
+        scale = pdf.font_size / 1000
+
+        def measure(s):
+            return sum(map(char_widths.__getitem__, s)) * scale
+    else:
+        measure = pdf.get_string_width
+
+    space = measure(" ")
+    line, line_width = [], 0.0
+    for word in text.split():
+        word_width = measure(word)
+        if line and line_width + space + word_width > width:
+            yield " ".join(line)
+            line, line_width = [word], word_width
+        else:
+            line_width += (space if line else 0.0) + word_width
+            line.append(word)
+    if line:
+        yield " ".join(line)
+
+
+def _pdf_line(pdf, h, text, indent=0):
+    """
+    Write `text` wrapped to the page width, `indent` mm in from the margin.
+    """
+    width = pdf.epw - indent
+    for line in wrap_text(pdf, pdf_text(text), width - 2 * pdf.c_margin):
+        pdf.set_x(pdf.l_margin + indent)
+        pdf.cell(width, h, line, new_x="LMARGIN", new_y="NEXT")
+
+
+def write_pdf_summary(responses, bank, fp, generated_at=None):
+    """
+    Render the session summary as a PDF into the binary file-like object `fp`
+    and return the number of pages.
+
+    Responses are laid out one at a time and pages are broken as they fill,
+    so the cost grows linearly with the session.
+    """
+    if generated_at is None:
+        generated_at = datetime.now()
+
+    pdf = FPDF(format="A4")
+    pdf.set_title("Anatomy MCQ Session Summary")
+    pdf.set_auto_page_break(True, margin=15)
+    pdf.add_page()
+
+    header = _header_lines(responses, generated_at)
+    pdf.set_font("Helvetica", "B", 16)
+    pdf.cell(0, 10, header[0], new_x="LMARGIN", new_y="NEXT")
+    pdf.set_font("Helvetica", "", 11)
+    for line in header[1:]:
+        pdf.cell(0, 6, line, new_x="LMARGIN", new_y="NEXT")
+    pdf.ln(4)
+
+    for i, resp in enumerate(responses, start=1):
+        block = _response_block(resp, bank)
+
+        pdf.set_font("Helvetica", "B", 11)
+        _pdf_line(pdf, 6, f"Q{i}. {block['heading']}")
+        pdf.set_font("Helvetica", "", 10)
+        for opt in block["options"]:
+            _pdf_line(pdf, 5, opt, indent=4)
+
+        pdf.cell(0, 6, f"Your answer: {block['your_answer']}    "
+                       f"Correct answer: {block['correct_answer']}    Result: ",
+                 new_x="END", new_y="TOP")
+        if block["correct"]:
+            pdf.set_text_color(0, 128, 0)
+            pdf.cell(0, 6, "Correct", new_x="LMARGIN", new_y="NEXT")
+        else:
+            pdf.set_text_color(190, 0, 0)
+            pdf.cell(0, 6, "Incorrect", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_text_color(0, 0, 0)
+
+        pdf.set_font("Helvetica", "I", 10)
+        _pdf_line(pdf, 5, f"Explanation: {block['explanation']}")
+        pdf.ln(1)
+        pdf.line(pdf.l_margin, pdf.get_y(), pdf.w - pdf.r_margin, pdf.get_y())
+        pdf.ln(3)
+
+    pdf.output(fp)
+    return pdf.page
+
+
+def generate_pdf_summary(responses, bank, generated_at=None):
+    """
+    Return the PDF summary as bytes.
+    """
+    buf = BytesIO()
+    write_pdf_summary(responses, bank, buf, generated_at)
+    return buf.getvalue()
+
+
+# -------------------------------------------------
+# Memoization
+# -------------------------------------------------
+
+def response_fingerprint(responses):
+    """
+    Cheap, stable digest of (question id, selected index, correct) for every
+    response, in order. Timestamps are deliberately left out.
+    """
+    ids = array("I", (r.question_id for r in responses))
+    selected = array("B", (255 if r.selected_index is None else r.selected_index
+                           for r in responses))
+    correct = array("B", (1 if r.correct else 0 for r in responses))
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(ids.tobytes())
+    h.update(selected.tobytes())
+    h.update(correct.tobytes())
+    return h.hexdigest()
+
+
+class LRUCache:
+    """
+    Thread-safe LRU mapping of str/bytes values, bounded by their total
+    len() rather than by the number of entries. A value larger than the
+    whole bound is returned but not kept.
+
+    The download callable runs on its own thread, so lookups and inserts
+    are guarded by a lock. The value is built outside the lock.
+    """
+
+    def __init__(self, maxbytes):
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get_or_create(self, key, factory):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+
+        value = factory()
+        if len(value) > self.maxbytes:
+            return value
+
+        with self._lock:
+            if key in self._data:  # built meanwhile by another thread
+                self.nbytes -= len(self._data.pop(key))
+            self._data[key] = value
+            self.nbytes += len(value)
+            while self.nbytes > self.maxbytes:
+                _key, old = self._data.popitem(last=False)
+                self.nbytes -= len(old)
+        return value
+
+
+_summary_cache = LRUCache(SUMMARY_CACHE_BYTES)
+
+
+def cached_summary(kind, responses, bank, build, generated_at):
+    """
+    Return build() for this (kind, bank, responses), memoized by fingerprint.
+    The summary prints generated_at to the minute, so the key includes that
+    minute: a later download, or another student with the same answers,
+    never gets an old date.
+    """
+    key = (
+        kind,
+        getattr(bank, "path", id(bank)),
+        response_fingerprint(responses),
+        generated_at.strftime("%Y-%m-%d %H:%M"),
+    )
+    return _summary_cache.get_or_create(key, build)
+
+
+def cached_text_summary(responses, bank, generated_at=None):
+    """
+    generate_text_summary(), memoized on the response fingerprint.
+    """
+    generated_at = datetime.now() if generated_at is None else generated_at
+    return cached_summary(
+        "text", responses, bank,
+        lambda: generate_text_summary(responses, bank, generated_at), generated_at,
+    )
+
+
+def cached_pdf_summary(responses, bank, generated_at=None):
+    """
+    generate_pdf_summary(), memoized on the response fingerprint.
+    """
+    generated_at = datetime.now() if generated_at is None else generated_at
+    return cached_summary(
+        "pdf", responses, bank,
+        lambda: generate_pdf_summary(responses, bank, generated_at), generated_at,
+    )
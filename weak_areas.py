@@ -0,0 +1,177 @@
+# weak_areas.py
+# "Focus on weak areas" study mode for the Anatomy MCQ Trainer.
+#
+# Questions are drawn at random with probability weighted by the user's
+# error rate, in two stages: a topic, weighted by its error rate times the
+# questions it has left, then a question within it, weighted by that
+# question's own error rate. Both stages use Walker/Vose alias tables, so
+# a draw is O(1). Per-question tables are split into fixed-size blocks under
+# a small table of block totals, so changing one weight (a question drawn,
+# or answered) rebuilds one block and the block totals rather than the
+# whole table, and a new answer only rebuilds the per-topic table.
+
+import random
+
+from quiz_order import DynamicOrder
+
+# weight of a question the user has never answered: an even chance of
+# getting it wrong
+UNSEEN_WEIGHT = 0.5
+# added to every seen question so mastered ones still come up now and then
+WEIGHT_FLOOR = 0.05
+
+BLOCK_SIZE = 128
+
+
+class AliasTable:
+    """
+    Walker/Vose alias table: draw() picks index i with probability
+    weights[i] / sum(weights) in O(1). Building it is O(n).
+    """
+
+    def __init__(self, weights):
+        self.weights = weights
+        n = len(weights)
+        self.total = sum(weights)
+        self._prob = [1.0] * n
+        self._alias = list(range(n))
+        if self.total <= 0:
+            return
+
+        scaled = [w * n / self.total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self._prob[s] = scaled[s]
+            self._alias[s] = l
+            scaled[l] += scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # whatever is left is within rounding error of 1
+
+    def __len__(self):
+        return len(self.weights)
+
+    def draw(self, rng):
+        while True:
+            i = int(rng.random() * len(self.weights))
+            if rng.random() >= self._prob[i]:
+                i = self._alias[i]
+            # a zero weight can only come out through rounding; draw again
+            if self.weights[i] > 0:
+                return i
+
+
+class BlockedAliasSampler:
+    """
+    Weighted sampler over n items with O(1) draws and cheap updates: one
+    alias table per block of `block_size` items and one over the block
+    totals. update() rebuilds a single block plus the totals table.
+    """
+
+    def __init__(self, weights, block_size=BLOCK_SIZE):
+        self.block_size = block_size
+        self.weights = list(weights)
+        self._blocks = [
+            AliasTable(self.weights[start:start + block_size])
+            for start in range(0, len(self.weights), block_size)
+        ]
+        self._top = AliasTable([block.total for block in self._blocks])
+
+    def __len__(self):
+        return len(self.weights)
+
+    @property
+    def total(self):
+        return self._top.total
+
+    def update(self, i, weight):
+        self.weights[i] = weight
+        b = i // self.block_size
+        start = b * self.block_size
+        self._blocks[b] = AliasTable(self.weights[start:start + self.block_size])
+        self._top = AliasTable([block.total for block in self._blocks])
+
+    def draw(self, rng):
+        b = self._top.draw(rng)
+        return b * self.block_size + self._blocks[b].draw(rng)
+
+
+def _error_rate(wrong, seen):
+    return (wrong + 1) / (seen + 2)  # Laplace-smoothed
+
+
+class WeakAreaOrder(DynamicOrder):
+    """
+    Question order of a weakness-weighted quiz of up to `length` questions,
+    drawn without repeats from `topic` (or explicit `positions`).
+
+    A dynamic order (see quiz_order.DynamicOrder): `history` is the user's
+    earlier answers as (question_id, correct, answered_at) rows, and each
+    first answer is folded into the topic weights for the draws that follow.
+    """
+
+    def __init__(self, bank, topic_index, history, length, topic=None, seed=0, positions=None):
+        self.bank = bank
+        self._rng = random.Random(seed)
+
+        self._question_seen = {}
+        self._question_wrong = {}
+        self._topic_seen = [0] * len(bank.topics)
+        self._topic_wrong = [0] * len(bank.topics)
+        for question_id, correct, _answered_at in history:
+            try:
+                pos = bank.position_of(question_id)
+            except KeyError:
+                continue
+            self._count(pos, correct)
+
+        # candidate positions grouped by topic, each group with its sampler
+        if positions is None:
+            positions = topic_index.positions(topic)
+        groups = {}
+        for pos in positions:
+            groups.setdefault(bank.topic_ids[pos], []).append(pos)
+        self._topic_ids = sorted(groups)
+        self._members = [groups[t] for t in self._topic_ids]
+        self._samplers = [
+            BlockedAliasSampler([self._question_weight(pos) for pos in members])
+            for members in self._members
+        ]
+        self._remaining = [len(members) for members in self._members]
+        self._rebuild_topics()
+
+        super().__init__(topic, seed, min(length, sum(self._remaining)))
+
+    def _count(self, pos, correct):
+        t = self.bank.topic_ids[pos]
+        self._topic_seen[t] += 1
+        self._question_seen[pos] = self._question_seen.get(pos, 0) + 1
+        if not correct:
+            self._topic_wrong[t] += 1
+            self._question_wrong[pos] = self._question_wrong.get(pos, 0) + 1
+
+    def _question_weight(self, pos):
+        seen = self._question_seen.get(pos, 0)
+        if not seen:
+            return UNSEEN_WEIGHT
+        return WEIGHT_FLOOR + _error_rate(self._question_wrong.get(pos, 0), seen)
+
+    def _rebuild_topics(self):
+        self._topics_table = AliasTable([
+            self._remaining[g] * _error_rate(self._topic_wrong[t], self._topic_seen[t])
+            for g, t in enumerate(self._topic_ids)
+        ])
+
+    def _pick(self):
+        g = self._topics_table.draw(self._rng)
+        i = self._samplers[g].draw(self._rng)
+        # no repeats within the quiz: the drawn question drops out
+        self._samplers[g].update(i, 0.0)
+        self._remaining[g] -= 1
+        self._rebuild_topics()
+        return self._members[g][i]
+
+    def _update(self, pos, resp):
+        self._count(pos, resp.correct)
+        self._rebuild_topics()